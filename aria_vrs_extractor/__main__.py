@@ -1,5 +1,5 @@
-from .cli import app
+from .fastcli import main
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -1,65 +1,53 @@
-"""Typer CLI entrypoint for aria_vrs_extractor."""
+"""Typer CLI entrypoint for aria_vrs_extractor.
+
+Command logic lives in :mod:`aria_vrs_extractor.commands`. The console script
+goes through :mod:`aria_vrs_extractor.fastcli`, which only builds this app for
+``--help`` and argument errors.
+"""
 
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 import typer
 
-from .config import ExtractorConfig
-from .constants import DEFAULT_QUALITY_FLAGS
-from .io import Filesystem
-from .logger import get_logger
-from .operations import (
-    extract_audio,
-    extract_bluetooth,
-    extract_et,
-    extract_gps,
-    extract_imu,
-    extract_rgb,
-    extract_wifi,
-    merge_events,
-    write_manifest,
-)
-from .paths import OutputLayout
-from .quality import QualityFlagger
+from . import commands
+from .commands import UsageError
 
 app = typer.Typer(no_args_is_help=True, add_completion=False)
-logger = get_logger()
 
 
-def resolve_config(
+def _invoke(func: Callable[..., None], /, *args: Any, **kwargs: Any) -> None:
+    try:
+        func(*args, **kwargs)
+    except UsageError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+
+def _extract(
+    stream: str,
     *,
-    config_path: Optional[Path],
+    vrs: Path,
+    config: Optional[Path],
+    out: Optional[str],
     device_id: Optional[str],
     recording_id: Optional[str],
-    output_root: Optional[str],
-) -> ExtractorConfig:
-    if config_path:
-        config = ExtractorConfig.from_yaml(config_path)
-    else:
-        if not (device_id and recording_id and output_root):
-            raise typer.BadParameter(
-                "When --config is not provided you must specify --device-id, --recording-id and --out"
-            )
-        config = ExtractorConfig(
-            device_id=device_id,
-            recording_id=recording_id,
-            output_root=output_root,
-        )
-    if device_id:
-        config.device_id = device_id
-    if recording_id:
-        config.recording_id = recording_id
-    if output_root:
-        config.output_root = output_root
-    return config
-
-
-def build_quality_flagger(config: ExtractorConfig) -> QualityFlagger:
-    enabled = config.quality_flags.enabled or DEFAULT_QUALITY_FLAGS
-    return QualityFlagger(enabled_flags=enabled)
+    force: bool,
+    configure: Optional[Callable[..., None]] = None,
+) -> None:
+    _invoke(
+        commands.run_extract,
+        stream,
+        vrs=str(vrs),
+        config_path=config,
+        out=out,
+        device_id=device_id,
+        recording_id=recording_id,
+        force=force,
+        configure=configure,
+    )
 
 
 @app.command("extract-rgb")
@@ -72,25 +60,15 @@ def cli_extract_rgb(
     downscale: Optional[Tuple[int, int]] = typer.Option(None, "--downscale", help="Optional downscale width height"),
     force: bool = typer.Option(False, "--force", help="Re-run even if step is marked done"),
 ) -> None:
-    cfg = resolve_config(
-        config_path=config,
+    _extract(
+        "rgb",
+        vrs=vrs,
+        config=config,
+        out=out,
         device_id=device_id,
         recording_id=recording_id,
-        output_root=out,
-    )
-    if downscale:
-        cfg.rgb.downscale = (int(downscale[0]), int(downscale[1]))
-    fs = Filesystem()
-    layout = OutputLayout.from_config(cfg)
-    flagger = build_quality_flagger(cfg)
-    extract_rgb(
-        fs=fs,
-        config=cfg,
-        layout=layout,
-        quality_flagger=flagger,
-        vrs_path=str(vrs),
         force=force,
-        logger=logger,
+        configure=partial(commands.apply_rgb_options, downscale=downscale),
     )
 
 
@@ -106,27 +84,15 @@ def cli_extract_et(
     downscale: Optional[Tuple[int, int]] = typer.Option(None, "--downscale"),
     force: bool = typer.Option(False, "--force"),
 ) -> None:
-    cfg = resolve_config(
-        config_path=config,
+    _extract(
+        "et",
+        vrs=vrs,
+        config=config,
+        out=out,
         device_id=device_id,
         recording_id=recording_id,
-        output_root=out,
-    )
-    cfg.et.left = left
-    cfg.et.right = right
-    if downscale:
-        cfg.et.downscale = (int(downscale[0]), int(downscale[1]))
-    fs = Filesystem()
-    layout = OutputLayout.from_config(cfg)
-    flagger = build_quality_flagger(cfg)
-    extract_et(
-        fs=fs,
-        config=cfg,
-        layout=layout,
-        quality_flagger=flagger,
-        vrs_path=str(vrs),
         force=force,
-        logger=logger,
+        configure=partial(commands.apply_et_options, left=left, right=right, downscale=downscale),
     )
 
 
@@ -138,27 +104,18 @@ def cli_extract_audio(
     device_id: Optional[str] = typer.Option(None, "--device-id"),
     recording_id: Optional[str] = typer.Option(None, "--recording-id"),
     chunk_samples: Optional[int] = typer.Option(None, "--chunk-samples", help="Target chunk size"),
+    layout: Optional[str] = typer.Option(None, "--layout", help="chunks (one WAV per chunk) or single (one audio.wav)"),
     force: bool = typer.Option(False, "--force"),
 ) -> None:
-    cfg = resolve_config(
-        config_path=config,
+    _extract(
+        "audio",
+        vrs=vrs,
+        config=config,
+        out=out,
         device_id=device_id,
         recording_id=recording_id,
-        output_root=out,
-    )
-    if chunk_samples:
-        cfg.audio.chunk_samples = int(chunk_samples)
-    fs = Filesystem()
-    layout = OutputLayout.from_config(cfg)
-    flagger = build_quality_flagger(cfg)
-    extract_audio(
-        fs=fs,
-        config=cfg,
-        layout=layout,
-        quality_flagger=flagger,
-        vrs_path=str(vrs),
         force=force,
-        logger=logger,
+        configure=partial(commands.apply_audio_options, chunk_samples=chunk_samples, layout=layout),
     )
 
 
@@ -171,24 +128,7 @@ def cli_extract_imu(
     recording_id: Optional[str] = typer.Option(None, "--recording-id"),
     force: bool = typer.Option(False, "--force"),
 ) -> None:
-    cfg = resolve_config(
-        config_path=config,
-        device_id=device_id,
-        recording_id=recording_id,
-        output_root=out,
-    )
-    fs = Filesystem()
-    layout = OutputLayout.from_config(cfg)
-    flagger = build_quality_flagger(cfg)
-    extract_imu(
-        fs=fs,
-        config=cfg,
-        layout=layout,
-        quality_flagger=flagger,
-        vrs_path=str(vrs),
-        force=force,
-        logger=logger,
-    )
+    _extract("imu", vrs=vrs, config=config, out=out, device_id=device_id, recording_id=recording_id, force=force)
 
 
 @app.command("extract-gps")
@@ -200,24 +140,7 @@ def cli_extract_gps(
     recording_id: Optional[str] = typer.Option(None, "--recording-id"),
     force: bool = typer.Option(False, "--force"),
 ) -> None:
-    cfg = resolve_config(
-        config_path=config,
-        device_id=device_id,
-        recording_id=recording_id,
-        output_root=out,
-    )
-    fs = Filesystem()
-    layout = OutputLayout.from_config(cfg)
-    flagger = build_quality_flagger(cfg)
-    extract_gps(
-        fs=fs,
-        config=cfg,
-        layout=layout,
-        quality_flagger=flagger,
-        vrs_path=str(vrs),
-        force=force,
-        logger=logger,
-    )
+    _extract("gps", vrs=vrs, config=config, out=out, device_id=device_id, recording_id=recording_id, force=force)
 
 
 @app.command("extract-wifi")
@@ -229,24 +152,7 @@ def cli_extract_wifi(
     recording_id: Optional[str] = typer.Option(None, "--recording-id"),
     force: bool = typer.Option(False, "--force"),
 ) -> None:
-    cfg = resolve_config(
-        config_path=config,
-        device_id=device_id,
-        recording_id=recording_id,
-        output_root=out,
-    )
-    fs = Filesystem()
-    layout = OutputLayout.from_config(cfg)
-    flagger = build_quality_flagger(cfg)
-    extract_wifi(
-        fs=fs,
-        config=cfg,
-        layout=layout,
-        quality_flagger=flagger,
-        vrs_path=str(vrs),
-        force=force,
-        logger=logger,
-    )
+    _extract("wifi", vrs=vrs, config=config, out=out, device_id=device_id, recording_id=recording_id, force=force)
 
 
 @app.command("extract-bt")
@@ -258,23 +164,27 @@ def cli_extract_bt(
     recording_id: Optional[str] = typer.Option(None, "--recording-id"),
     force: bool = typer.Option(False, "--force"),
 ) -> None:
-    cfg = resolve_config(
+    _extract("bt", vrs=vrs, config=config, out=out, device_id=device_id, recording_id=recording_id, force=force)
+
+
+@app.command("extract-all")
+def cli_extract_all(
+    vrs: Path = typer.Option(..., help="Input VRS file"),
+    config: Optional[Path] = typer.Option(None, "--config", "-c", help="Configuration YAML path"),
+    out: Optional[str] = typer.Option(None, "--out", help="Output root (overrides config)"),
+    device_id: Optional[str] = typer.Option(None, "--device-id", help="Device identifier"),
+    recording_id: Optional[str] = typer.Option(None, "--recording-id", help="Recording identifier"),
+    force: bool = typer.Option(False, "--force", help="Re-run even if steps are marked done"),
+) -> None:
+    """Run every extractor enabled in the configuration against one opened VRS file."""
+    _invoke(
+        commands.run_extract_all,
+        vrs=str(vrs),
         config_path=config,
+        out=out,
         device_id=device_id,
         recording_id=recording_id,
-        output_root=out,
-    )
-    fs = Filesystem()
-    layout = OutputLayout.from_config(cfg)
-    flagger = build_quality_flagger(cfg)
-    extract_bluetooth(
-        fs=fs,
-        config=cfg,
-        layout=layout,
-        quality_flagger=flagger,
-        vrs_path=str(vrs),
         force=force,
-        logger=logger,
     )
 
 
@@ -283,13 +193,15 @@ def cli_merge_events(
     root: str = typer.Option(..., "--root", help="Extraction root"),
     force: bool = typer.Option(False, "--force"),
 ) -> None:
-    fs = Filesystem()
-    merge_events(fs=fs, root=root, force=force, logger=logger)
+    commands.run_merge_events(root=root, force=force)
 
 
 @app.command("write-manifest")
 def cli_write_manifest(
     root: str = typer.Option(..., "--root", help="Extraction root"),
+    config: Optional[Path] = typer.Option(
+        None, "--config", "-c", help="Configuration YAML; supplies checksum_workers when the flag is omitted"
+    ),
     owner: str = typer.Option(..., "--owner", help="Owner string for lineage"),
     tool_version: str = typer.Option(..., "--tool-version", help="Tool version identifier"),
     upstream: List[str] = typer.Option([], "--upstream", help="Upstream VRS URIs"),
@@ -297,10 +209,11 @@ def cli_write_manifest(
     device_id: Optional[str] = typer.Option(None, "--device-id", help="Device identifier"),
     recording_id: Optional[str] = typer.Option(None, "--recording-id", help="Recording identifier"),
     partition_dt: Optional[str] = typer.Option(None, "--partition-dt", help="Partition dt override (YYYY/MM/DD)"),
+    checksum_workers: Optional[int] = typer.Option(None, "--checksum-workers", help="Threads used for checksums"),
+    blake3: bool = typer.Option(False, "--blake3", help="Also record BLAKE3 checksums (requires the blake3 package)"),
 ) -> None:
-    fs = Filesystem()
-    write_manifest(
-        fs=fs,
+    _invoke(
+        commands.run_write_manifest,
         root=root,
         owner=owner,
         tool_version=tool_version,
@@ -309,7 +222,9 @@ def cli_write_manifest(
         device_id=device_id,
         recording_id=recording_id,
         partition_dt=partition_dt,
-        logger=logger,
+        checksum_workers=checksum_workers,
+        blake3=blake3,
+        config_path=config,
     )
 
 
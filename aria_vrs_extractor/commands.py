@@ -0,0 +1,245 @@
+"""Command implementations shared by the Typer CLI and the argparse fast path.
+
+Nothing here imports Typer, and operation modules are imported only when the
+command that needs them runs.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .config import AUDIO_LAYOUTS, Downscale, ExtractorConfig
+from .constants import DEFAULT_QUALITY_FLAGS
+from .io import Filesystem
+from .logger import get_logger
+from .paths import OutputLayout
+from .quality import QualityFlagger, laplacian_variance
+
+logger = get_logger()
+
+# stream name -> (operations submodule, function name), in extract-all order
+EXTRACTORS: Dict[str, Tuple[str, str]] = {
+    "rgb": ("rgb", "extract_rgb"),
+    "et": ("et", "extract_et"),
+    "audio": ("audio", "extract_audio"),
+    "imu": ("imu", "extract_imu"),
+    "gps": ("gps", "extract_gps"),
+    "wifi": ("wifi", "extract_wifi"),
+    "bt": ("bt", "extract_bluetooth"),
+}
+
+
+class UsageError(ValueError):
+    """Raised when command-line arguments are missing or inconsistent."""
+
+
+def resolve_config(
+    *,
+    config_path: Optional[Path],
+    device_id: Optional[str],
+    recording_id: Optional[str],
+    output_root: Optional[str],
+) -> ExtractorConfig:
+    if config_path:
+        config = ExtractorConfig.from_yaml(config_path)
+    else:
+        if not (device_id and recording_id and output_root):
+            raise UsageError(
+                "When --config is not provided you must specify --device-id, --recording-id and --out"
+            )
+        config = ExtractorConfig(
+            device_id=device_id,
+            recording_id=recording_id,
+            output_root=output_root,
+        )
+    if device_id:
+        config.device_id = device_id
+    if recording_id:
+        config.recording_id = recording_id
+    if output_root:
+        config.output_root = output_root
+    return config
+
+
+def build_filesystem(config: ExtractorConfig) -> Filesystem:
+    return Filesystem(max_workers=config.checksum_workers)
+
+
+def build_quality_flagger(config: ExtractorConfig) -> QualityFlagger:
+    enabled = config.quality_flags.enabled or DEFAULT_QUALITY_FLAGS
+    flagger = QualityFlagger(enabled_flags=enabled)
+    threshold = config.quality_flags.blur_threshold
+    if threshold is not None and "blur" in enabled:
+        flagger.register_frame("blur", lambda frame: laplacian_variance(frame) < threshold, sensors=("rgb", "et"))
+    return flagger
+
+
+def _load_extractor(stream: str) -> Callable[..., None]:
+    module_name, func_name = EXTRACTORS[stream]
+    module = importlib.import_module(f".operations.{module_name}", __package__)
+    return getattr(module, func_name)
+
+
+def apply_rgb_options(config: ExtractorConfig, *, downscale: Optional[Sequence[int]]) -> None:
+    if downscale:
+        config.rgb = replace(config.rgb, downscale=Downscale(int(downscale[0]), int(downscale[1])))
+
+
+def apply_et_options(
+    config: ExtractorConfig,
+    *,
+    left: bool,
+    right: bool,
+    downscale: Optional[Sequence[int]],
+) -> None:
+    config.et = replace(config.et, left=left, right=right)
+    if downscale:
+        config.et = replace(config.et, downscale=Downscale(int(downscale[0]), int(downscale[1])))
+
+
+def apply_audio_options(
+    config: ExtractorConfig,
+    *,
+    chunk_samples: Optional[int],
+    layout: Optional[str] = None,
+) -> None:
+    if chunk_samples:
+        config.audio = replace(config.audio, chunk_samples=int(chunk_samples))
+    if layout:
+        if layout not in AUDIO_LAYOUTS:
+            raise UsageError(f"--layout must be one of {', '.join(AUDIO_LAYOUTS)}")
+        config.audio = replace(config.audio, layout=layout)
+
+
+def run_extract(
+    stream: str,
+    *,
+    vrs: str,
+    config_path: Optional[Path],
+    out: Optional[str],
+    device_id: Optional[str],
+    recording_id: Optional[str],
+    force: bool,
+    configure: Optional[Callable[[ExtractorConfig], None]] = None,
+) -> None:
+    """Run one stream extractor; ``configure`` applies command-specific overrides."""
+    cfg = resolve_config(
+        config_path=config_path,
+        device_id=device_id,
+        recording_id=recording_id,
+        output_root=out,
+    )
+    if configure:
+        configure(cfg)
+    _load_extractor(stream)(
+        fs=build_filesystem(cfg),
+        config=cfg,
+        layout=OutputLayout.from_config(cfg),
+        quality_flagger=build_quality_flagger(cfg),
+        vrs_path=vrs,
+        force=force,
+        logger=logger,
+    )
+
+
+def run_extract_all(
+    *,
+    vrs: str,
+    config_path: Optional[Path],
+    out: Optional[str],
+    device_id: Optional[str],
+    recording_id: Optional[str],
+    force: bool,
+) -> None:
+    """Run every extractor enabled in the configuration against one opened VRS file."""
+    cfg = resolve_config(
+        config_path=config_path,
+        device_id=device_id,
+        recording_id=recording_id,
+        output_root=out,
+    )
+    enabled = [stream for stream in EXTRACTORS if getattr(cfg, stream).export]
+    if not enabled:
+        logger.info(
+            "All streams disabled by configuration",
+            extra={"step": "extract_all", "device_id": cfg.device_id, "recording_id": cfg.recording_id},
+        )
+        return
+    from .provider import AriaVrsProvider
+
+    fs = build_filesystem(cfg)
+    layout = OutputLayout.from_config(cfg)
+    flagger = build_quality_flagger(cfg)
+    provider = AriaVrsProvider(vrs)
+    for stream in enabled:
+        _load_extractor(stream)(
+            fs=fs,
+            config=cfg,
+            layout=layout,
+            quality_flagger=flagger,
+            vrs_path=vrs,
+            force=force,
+            logger=logger,
+            provider=provider,
+        )
+
+
+def run_merge_events(*, root: str, force: bool) -> None:
+    from .operations.events import merge_events
+
+    merge_events(fs=Filesystem(), root=root, force=force, logger=logger)
+
+
+def run_write_manifest(
+    *,
+    root: str,
+    owner: str,
+    tool_version: str,
+    upstream: List[str],
+    transform: str,
+    device_id: Optional[str],
+    recording_id: Optional[str],
+    partition_dt: Optional[str],
+    checksum_workers: Optional[int],
+    blake3: bool,
+    config_path: Optional[Path] = None,
+) -> None:
+    """Write the manifest; ``checksum_workers`` falls back to the config's key when not given."""
+    if checksum_workers is not None and checksum_workers < 1:
+        raise UsageError("--checksum-workers must be a positive integer")
+    if checksum_workers is None and config_path:
+        checksum_workers = ExtractorConfig.from_yaml(config_path).checksum_workers
+    from .operations.manifest import write_manifest
+
+    write_manifest(
+        fs=Filesystem(max_workers=checksum_workers),
+        root=root,
+        owner=owner,
+        tool_version=tool_version,
+        upstream=list(upstream),
+        transform=transform,
+        device_id=device_id,
+        recording_id=recording_id,
+        partition_dt=partition_dt,
+        logger=logger,
+        with_blake3=blake3,
+    )
+
+
+__all__ = [
+    "EXTRACTORS",
+    "UsageError",
+    "apply_audio_options",
+    "apply_et_options",
+    "apply_rgb_options",
+    "build_filesystem",
+    "build_quality_flagger",
+    "resolve_config",
+    "run_extract",
+    "run_extract_all",
+    "run_merge_events",
+    "run_write_manifest",
+]
@@ -0,0 +1,64 @@
+"""Thread pool helpers for overlapping artifact writes with VRS decoding."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Optional, Tuple
+
+
+class OrderedTaskPool:
+    """Run tasks on worker threads and deliver their results in submission order.
+
+    ``on_result`` callbacks run on the submitting thread, either from a later
+    :meth:`submit` once the queue holds ``max_pending`` tasks or from
+    :meth:`drain`. Callers can therefore append to JSONL files and update
+    summaries without locking. The bound on pending tasks also limits how many
+    decoded frames are held in memory at once.
+    """
+
+    def __init__(self, max_workers: int, max_pending: Optional[int] = None) -> None:
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max_pending or self.max_workers * 2
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._pending: Deque[Tuple[Future, Optional[Callable[[Any], None]]]] = deque()
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        /,
+        *args: Any,
+        on_result: Optional[Callable[[Any], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        while len(self._pending) >= self.max_pending:
+            self._complete_oldest()
+        self._pending.append((self._executor.submit(fn, *args, **kwargs), on_result))
+
+    def _complete_oldest(self) -> None:
+        future, on_result = self._pending.popleft()
+        result = future.result()
+        if on_result is not None:
+            on_result(result)
+
+    def drain(self) -> None:
+        """Wait for every pending task and run its callback in order."""
+        while self._pending:
+            self._complete_oldest()
+
+    def __enter__(self) -> "OrderedTaskPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.drain()
+            else:
+                for future, _ in self._pending:
+                    future.cancel()
+                self._pending.clear()
+        finally:
+            self._executor.shutdown(wait=True)
+
+
+__all__ = ["OrderedTaskPool"]
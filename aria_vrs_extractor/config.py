@@ -2,14 +2,93 @@
 
 from __future__ import annotations
 
+import json
+import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
 
-import yaml
+from .jsonutils import loads as _json_loads
 
+CONFIG_CACHE_SUFFIX = ".cache.json"
 
-@dataclass(slots=True)
+
+def _parse_yaml(content: str) -> Any:
+    # PyYAML is only imported when no valid JSON cache exists for the file
+    import yaml
+
+    try:  # pragma: no cover - depends on PyYAML being built against libyaml
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - pure-Python fallback
+        from yaml import SafeLoader as loader
+    return yaml.load(content, Loader=loader)
+
+
+def _read_config_cache(cache_path: Path, mtime_ns: int) -> Optional[Dict]:
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("source_mtime_ns") != mtime_ns:
+        return None
+    data = cached.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_config_cache(cache_path: Path, mtime_ns: int, data: Dict) -> None:
+    try:
+        encoded = json.dumps(data, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return  # YAML-only types (dates, ...) cannot round-trip through JSON
+    if json.loads(encoded) != data:
+        return  # e.g. non-string keys would be coerced
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp.{os.getpid()}")
+    try:
+        tmp_path.write_text(
+            f'{{"source_mtime_ns": {mtime_ns}, "data": {encoded}}}',
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # read-only config directories simply go without a cache
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=16)
+def _load_yaml(path_str: str, mtime_ns: int) -> Any:
+    """Parse a YAML config, reusing ``<file>.cache.json`` when its mtime stamp matches.
+
+    ``mtime_ns`` is part of the in-process cache key so edits invalidate both caches.
+    """
+    path = Path(path_str)
+    cache_path = path.with_name(path.name + CONFIG_CACHE_SUFFIX)
+    cached = _read_config_cache(cache_path, mtime_ns)
+    if cached is not None:
+        return cached
+    data = _parse_yaml(path.read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        _write_config_cache(cache_path, mtime_ns, data)
+    return data
+
+
+class Downscale(NamedTuple):
+    w: int
+    h: int
+
+
+def _coerce_downscale(value: Any, field_name: str) -> Optional[Downscale]:
+    if value is None:
+        return None
+    if isinstance(value, Sequence) and not isinstance(value, str) and len(value) == 2:
+        return Downscale(int(value[0]), int(value[1]))
+    raise ValueError(f"{field_name} must be a sequence of two integers or null")
+
+
+@dataclass(frozen=True, slots=True)
 class StreamToggle:
     export: bool = True
 
@@ -19,52 +98,47 @@ class StreamToggle:
         return cls(export=bool(payload.get("export", True)))
 
 
-@dataclass(slots=True)
-class RgbConfig(StreamToggle):
-    downscale: Optional[Tuple[int, int]] = None
+@dataclass(frozen=True, slots=True)
+class RgbConfig:
+    export: bool = True
+    downscale: Optional[Downscale] = None
 
     @classmethod
     def from_dict(cls, payload: Optional[Dict]) -> "RgbConfig":
         payload = payload or {}
-        downscale_value = payload.get("downscale")
-        if downscale_value is not None:
-            if isinstance(downscale_value, Sequence) and len(downscale_value) == 2:
-                downscale = (int(downscale_value[0]), int(downscale_value[1]))
-            else:
-                raise ValueError("rgb.downscale must be a sequence of two integers or null")
-        else:
-            downscale = None
-        return cls(export=bool(payload.get("export", True)), downscale=downscale)
+        return cls(
+            export=bool(payload.get("export", True)),
+            downscale=_coerce_downscale(payload.get("downscale"), "rgb.downscale"),
+        )
 
 
-@dataclass(slots=True)
-class EyeTrackingConfig(StreamToggle):
+@dataclass(frozen=True, slots=True)
+class EyeTrackingConfig:
+    export: bool = True
     left: bool = True
     right: bool = True
-    downscale: Optional[Tuple[int, int]] = None
+    downscale: Optional[Downscale] = None
 
     @classmethod
     def from_dict(cls, payload: Optional[Dict]) -> "EyeTrackingConfig":
         payload = payload or {}
-        downsample_value = payload.get("downscale")
-        if downsample_value is not None:
-            if isinstance(downsample_value, Sequence) and len(downsample_value) == 2:
-                downscale = (int(downsample_value[0]), int(downsample_value[1]))
-            else:
-                raise ValueError("et.downscale must be a sequence of two integers or null")
-        else:
-            downscale = None
         return cls(
             export=bool(payload.get("export", True)),
             left=bool(payload.get("left", True)),
             right=bool(payload.get("right", True)),
-            downscale=downscale,
+            downscale=_coerce_downscale(payload.get("downscale"), "et.downscale"),
         )
 
 
-@dataclass(slots=True)
-class AudioConfig(StreamToggle):
+AUDIO_LAYOUTS = ("chunks", "single")
+
+
+@dataclass(frozen=True, slots=True)
+class AudioConfig:
+    export: bool = True
     chunk_samples: int = 4096
+    # "chunks" writes one WAV per chunk; "single" appends every chunk to audio.wav
+    layout: str = "chunks"
 
     @classmethod
     def from_dict(cls, payload: Optional[Dict]) -> "AudioConfig":
@@ -72,7 +146,10 @@ class AudioConfig(StreamToggle):
         chunk_samples = int(payload.get("chunk_samples", 4096))
         if chunk_samples not in (2048, 4096):
             raise ValueError("audio.chunk_samples must be either 2048 or 4096")
-        return cls(export=bool(payload.get("export", True)), chunk_samples=chunk_samples)
+        layout = str(payload.get("layout", "chunks"))
+        if layout not in AUDIO_LAYOUTS:
+            raise ValueError(f"audio.layout must be one of {', '.join(AUDIO_LAYOUTS)}")
+        return cls(export=bool(payload.get("export", True)), chunk_samples=chunk_samples, layout=layout)
 
 
 @dataclass(slots=True)
@@ -113,16 +190,23 @@ class PartitionKeys:
 @dataclass(slots=True)
 class QualityFlags:
     enabled: List[str] = field(default_factory=lambda: ["blur", "drop_frame", "audio_clipping"])
+    # RGB/ET frames whose Laplacian variance is below this are flagged "blur"; None disables the check
+    blur_threshold: Optional[float] = None
 
     @classmethod
     def from_dict(cls, payload: Optional[Dict]) -> "QualityFlags":
         payload = payload or {}
+        blur_threshold = payload.get("blur_threshold")
+        if blur_threshold is not None:
+            blur_threshold = float(blur_threshold)
+            if blur_threshold < 0:
+                raise ValueError("quality_flags.blur_threshold must be a non-negative number or null")
         enabled = payload.get("enabled")
         if enabled is None:
-            return cls()
+            return cls(blur_threshold=blur_threshold)
         if not isinstance(enabled, Iterable):
             raise ValueError("quality_flags.enabled must be an iterable of strings")
-        return cls(enabled=[str(flag) for flag in enabled])
+        return cls(enabled=[str(flag) for flag in enabled], blur_threshold=blur_threshold)
 
 
 @dataclass(slots=True)
@@ -140,6 +224,7 @@ class ExtractorConfig:
     paths: PathsConfig = field(default_factory=PathsConfig)
     partition_keys: PartitionKeys = field(default_factory=PartitionKeys)
     quality_flags: QualityFlags = field(default_factory=QualityFlags)
+    checksum_workers: Optional[int] = None
 
     @classmethod
     def from_dict(cls, data: Dict) -> "ExtractorConfig":
@@ -151,6 +236,11 @@ class ExtractorConfig:
             output_root = str(data["output_root"])
         except KeyError as exc:  # pragma: no cover - defensive programming
             raise KeyError(f"Missing required config key: {exc.args[0]}") from exc
+        checksum_workers = data.get("checksum_workers")
+        if checksum_workers is not None:
+            checksum_workers = int(checksum_workers)
+            if checksum_workers < 1:
+                raise ValueError("checksum_workers must be a positive integer or null")
 
         return cls(
             device_id=device_id,
@@ -166,19 +256,21 @@ class ExtractorConfig:
             paths=PathsConfig.from_dict(data.get("paths")),
             partition_keys=PartitionKeys.from_dict(data.get("partition_keys")),
             quality_flags=QualityFlags.from_dict(data.get("quality_flags")),
+            checksum_workers=checksum_workers,
         )
 
     @classmethod
     def from_yaml(cls, path: Path | str) -> "ExtractorConfig":
         path = Path(path)
-        content = path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
+        data = _load_yaml(str(path), path.stat().st_mtime_ns)
         if not isinstance(data, dict):
             raise ValueError("YAML configuration must evaluate to a dictionary")
         return cls.from_dict(data)
 
 
 __all__ = [
+    "AUDIO_LAYOUTS",
+    "Downscale",
     "ExtractorConfig",
     "StreamToggle",
     "RgbConfig",
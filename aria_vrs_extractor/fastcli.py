@@ -0,0 +1,156 @@
+"""argparse dispatcher used by the console script.
+
+Building the Typer app (and importing Click) costs more than most extraction
+steps take to start, so well-formed invocations are parsed here with argparse
+and handed straight to :mod:`aria_vrs_extractor.commands`. Anything that needs
+help text or error reporting (no arguments, ``--help``, an unknown option, a
+missing required value) is re-dispatched to the Typer app in :mod:`.cli` so
+users see the same messages as before.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from functools import partial
+from pathlib import Path
+from typing import List, NoReturn, Optional, Sequence
+
+from . import commands
+
+PROG_NAME = "aria-vrs-extract"
+
+
+class _FallbackToTyper(Exception):
+    pass
+
+
+class _Parser(argparse.ArgumentParser):
+    def __init__(self, *args, **kwargs) -> None:
+        # Click has no prefix matching, so "--ro" must not quietly mean "--root" here
+        kwargs.setdefault("allow_abbrev", False)
+        super().__init__(*args, **kwargs)
+
+    def error(self, message: str) -> NoReturn:
+        raise _FallbackToTyper(message)
+
+
+def _add_extract_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--vrs", required=True, type=Path)
+    parser.add_argument("--config", "-c", type=Path)
+    parser.add_argument("--out")
+    parser.add_argument("--device-id")
+    parser.add_argument("--recording-id")
+    parser.add_argument("--force", action="store_true")
+
+
+def _build_parser() -> _Parser:
+    parser = _Parser(prog=PROG_NAME, add_help=False)
+    subparsers = parser.add_subparsers(dest="command", required=True, parser_class=_Parser)
+    for stream in commands.EXTRACTORS:
+        sub = subparsers.add_parser(f"extract-{stream}", add_help=False)
+        _add_extract_options(sub)
+        sub.set_defaults(stream=stream)
+        if stream in ("rgb", "et"):
+            sub.add_argument("--downscale", nargs=2, type=int)
+        if stream == "et":
+            sub.add_argument("--left", action=argparse.BooleanOptionalAction, default=True)
+            sub.add_argument("--right", action=argparse.BooleanOptionalAction, default=True)
+        if stream == "audio":
+            sub.add_argument("--chunk-samples", type=int)
+            sub.add_argument("--layout")
+
+    _add_extract_options(subparsers.add_parser("extract-all", add_help=False))
+
+    merge = subparsers.add_parser("merge-events", add_help=False)
+    merge.add_argument("--root", required=True)
+    merge.add_argument("--force", action="store_true")
+
+    manifest = subparsers.add_parser("write-manifest", add_help=False)
+    manifest.add_argument("--root", required=True)
+    manifest.add_argument("--config", "-c", type=Path)
+    manifest.add_argument("--owner", required=True)
+    manifest.add_argument("--tool-version", required=True)
+    manifest.add_argument("--upstream", action="append", default=[])
+    manifest.add_argument("--transform", default="aria_vrs_extractor")
+    manifest.add_argument("--device-id")
+    manifest.add_argument("--recording-id")
+    manifest.add_argument("--partition-dt")
+    manifest.add_argument("--checksum-workers", type=int)
+    manifest.add_argument("--blake3", action="store_true")
+    return parser
+
+
+def _configure(args: argparse.Namespace):
+    if args.stream == "rgb":
+        return partial(commands.apply_rgb_options, downscale=args.downscale)
+    if args.stream == "et":
+        return partial(commands.apply_et_options, left=args.left, right=args.right, downscale=args.downscale)
+    if args.stream == "audio":
+        return partial(commands.apply_audio_options, chunk_samples=args.chunk_samples, layout=args.layout)
+    return None
+
+
+def _dispatch(args: argparse.Namespace) -> None:
+    if args.command == "merge-events":
+        commands.run_merge_events(root=args.root, force=args.force)
+    elif args.command == "write-manifest":
+        commands.run_write_manifest(
+            root=args.root,
+            owner=args.owner,
+            tool_version=args.tool_version,
+            upstream=args.upstream,
+            transform=args.transform,
+            device_id=args.device_id,
+            recording_id=args.recording_id,
+            partition_dt=args.partition_dt,
+            checksum_workers=args.checksum_workers,
+            blake3=args.blake3,
+            config_path=args.config,
+        )
+    elif args.command == "extract-all":
+        commands.run_extract_all(
+            vrs=str(args.vrs),
+            config_path=args.config,
+            out=args.out,
+            device_id=args.device_id,
+            recording_id=args.recording_id,
+            force=args.force,
+        )
+    else:
+        commands.run_extract(
+            args.stream,
+            vrs=str(args.vrs),
+            config_path=args.config,
+            out=args.out,
+            device_id=args.device_id,
+            recording_id=args.recording_id,
+            force=args.force,
+            configure=_configure(args),
+        )
+
+
+def _run_typer(argv: List[str]) -> None:
+    from .cli import app
+
+    app(args=argv, prog_name=PROG_NAME)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or "-h" in argv or "--help" in argv:
+        _run_typer(argv)
+        return
+    try:
+        args = _build_parser().parse_args(argv)
+    except _FallbackToTyper:
+        _run_typer(argv)
+        return
+    try:
+        _dispatch(args)
+    except commands.UsageError:
+        # let Typer render the usage error exactly as it always has
+        _run_typer(argv)
+
+
+__all__ = ["main"]
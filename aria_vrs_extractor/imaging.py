@@ -0,0 +1,97 @@
+"""Image helpers using libjpeg-turbo (PyTurboJPEG) and OpenCV when available."""
+
+from __future__ import annotations
+
+import io
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+try:  # pragma: no cover - optional dependency
+    import cv2
+except ModuleNotFoundError:  # pragma: no cover - fallback
+    cv2 = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import turbojpeg as _turbojpeg
+except ModuleNotFoundError:  # pragma: no cover - fallback
+    _turbojpeg = None  # type: ignore
+
+JPEG_QUALITY = 95
+
+
+@lru_cache(maxsize=1)
+def _turbo() -> Optional["_turbojpeg.TurboJPEG"]:
+    if _turbojpeg is None:
+        return None
+    try:
+        return _turbojpeg.TurboJPEG()
+    except (OSError, RuntimeError):  # pragma: no cover - python package without libturbojpeg
+        return None
+
+
+def _encode_turbo(encoder: "_turbojpeg.TurboJPEG", array: np.ndarray, quality: int) -> Optional[bytes]:
+    if array.dtype != np.uint8:
+        return None
+    if array.ndim == 2 or (array.ndim == 3 and array.shape[2] == 1):
+        pixel_format, subsample = _turbojpeg.TJPF_GRAY, _turbojpeg.TJSAMP_GRAY
+    elif array.ndim == 3 and array.shape[2] == 3:
+        # 4:2:0 matches Pillow's default so output does not depend on the backend
+        pixel_format, subsample = _turbojpeg.TJPF_RGB, _turbojpeg.TJSAMP_420
+    else:
+        return None
+    return encoder.encode(
+        np.ascontiguousarray(array),
+        quality=quality,
+        pixel_format=pixel_format,
+        jpeg_subsample=subsample,
+    )
+
+
+def _to_pil(array: np.ndarray) -> Image.Image:
+    """Wrap a C-contiguous ``uint8`` gray/RGB array without going through ``fromarray``."""
+    if array.dtype == np.uint8 and array.flags["C_CONTIGUOUS"]:
+        height, width = array.shape[:2]
+        if array.ndim == 2:
+            return Image.frombuffer("L", (width, height), array, "raw", "L", 0, 1)
+        if array.ndim == 3 and array.shape[2] == 3:
+            return Image.frombuffer("RGB", (width, height), array, "raw", "RGB", 0, 1)
+    return Image.fromarray(array)
+
+
+def encode_jpeg(array: np.ndarray, *, quality: int = JPEG_QUALITY) -> bytes:
+    """Encode a grayscale or RGB ``uint8`` array as JPEG bytes.
+
+    Uses libjpeg-turbo when PyTurboJPEG and its shared library are installed;
+    other inputs and environments go through Pillow.
+    """
+    encoder = _turbo()
+    if encoder is not None:
+        payload = _encode_turbo(encoder, array, quality)
+        if payload is not None:
+            return payload
+    buffer = io.BytesIO()
+    _to_pil(array).save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def resize(array: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Bilinearly resize an image array to ``width`` x ``height``.
+
+    Uses ``cv2.resize`` when OpenCV is installed, otherwise a Pillow round trip.
+    Pillow's bilinear filter widens with the scale factor when shrinking, so
+    OpenCV shrinks with ``INTER_AREA`` (``INTER_LINEAR`` would alias) to keep
+    downscaled frames, and the quality flags computed on them, comparable
+    across backends.
+    """
+    if cv2 is not None:
+        src_height, src_width = array.shape[:2]
+        shrinking = width <= src_width and height <= src_height
+        interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR
+        return cv2.resize(array, (width, height), interpolation=interpolation)
+    return np.array(_to_pil(array).resize((width, height), resample=Image.BILINEAR))
+
+
+__all__ = ["JPEG_QUALITY", "encode_jpeg", "resize"]
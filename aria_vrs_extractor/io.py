@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import hashlib
 import io
+import mmap
 import os
-import posixpath
+import re
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Dict, Iterable, Iterator, Optional, Tuple
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 try:  # pragma: no cover - optional dependency
@@ -17,22 +20,94 @@ try:  # pragma: no cover - optional dependency
 except ModuleNotFoundError:  # pragma: no cover - fallback
     fsspec = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency
+    import blake3 as _blake3
+except ModuleNotFoundError:  # pragma: no cover - fallback
+    _blake3 = None  # type: ignore
+
+_READ_CHUNK_SIZE = 1024 * 1024
+
+# Buffer size for JSONL outputs; records are small and written one at a time.
+JSONL_BUFFER_SIZE = 1024 * 1024
+
+# Number of encoded lines LineBuffer collects before joining them into one write.
+LINE_BATCH_SIZE = 4096
+
+# Concurrent whole-file reads against object stores, where each read is a round trip.
+_REMOTE_READERS = 32
+
+# Files at least this large hash MD5 (when requested) on a helper thread while SHA-256 runs on the caller.
+_PARALLEL_DIGEST_THRESHOLD = 4 * 1024 * 1024
+
+
+_SCHEME_RE = re.compile(r"^([a-zA-Z][a-zA-Z0-9+.\-]*)://")
+
+
+@lru_cache(maxsize=1024)
+def _is_remote_str(path: str) -> bool:
+    match = _SCHEME_RE.match(path)
+    return bool(match and match.group(1).lower() != "file")
+
 
 def is_remote(path: str | os.PathLike[str]) -> bool:
-    parsed = urlparse(str(path))
-    return bool(parsed.scheme and parsed.scheme != "file")
+    return _is_remote_str(str(path))
+
+
+def _clean_parts(parts: Tuple[str | os.PathLike[str], ...]) -> List[str]:
+    cleaned = []
+    for part in parts:
+        part_str = str(part).strip("/")
+        if part_str:
+            cleaned.append(part_str)
+    return cleaned
+
+
+def _normalize_local(path: str) -> str:
+    # os.path.join keeps "." segments and doubled or trailing separators that
+    # a PurePath join drops; only paths containing them pay for the round trip
+    if os.sep == "/" and not (
+        path.startswith("./") or path.endswith(("/", "/.")) or "//" in path or "/./" in path
+    ):
+        return path
+    return str(PurePath(path))
+
+
+def join_local(base: str | os.PathLike[str], *parts: str | os.PathLike[str]) -> str:
+    """Join path segments onto a local base, normalized like ``PurePath.joinpath``."""
+    return _normalize_local(os.path.join(str(base), *_clean_parts(parts)))
+
+
+def join_remote(base: str | os.PathLike[str], *parts: str | os.PathLike[str]) -> str:
+    """Join path segments onto a URI base with ``/`` separators."""
+    prefix = str(base).rstrip("/")
+    joined = "/".join(_clean_parts(parts))
+    if not joined:
+        return prefix
+    return f"{prefix}/{joined}"
+
+
+@lru_cache(maxsize=4096)
+def _join_two(base: str, part: str) -> str:
+    # same result as join_remote/join_local with a single part
+    part = part.strip("/")
+    if _is_remote_str(base):
+        base = base.rstrip("/")
+        return f"{base}/{part}" if part else base
+    return _normalize_local(os.path.join(base, part) if part else base)
 
 
 def join_uri(base: str | os.PathLike[str], *parts: str | os.PathLike[str]) -> str:
+    """Join ``parts`` onto a local path or URI base.
+
+    Folds over a cached two-part join, so the repeated ``(directory, name)``
+    joins made while building layouts and manifests are looked up, not rebuilt.
+    """
     base_str = str(base)
-    new_parts = [str(part).strip("/") for part in parts if str(part)]
-    if is_remote(base_str):
-        prefix = base_str.rstrip("/")
-        joined = "/".join(new_parts)
-        if not joined:
-            return prefix
-        return f"{prefix}/{joined}"
-    return str(Path(base_str).joinpath(*new_parts))
+    if not parts:
+        return join_remote(base_str) if _is_remote_str(base_str) else _normalize_local(base_str)
+    for part in parts:
+        base_str = _join_two(base_str, str(part))
+    return base_str
 
 
 @dataclass(slots=True)
@@ -40,25 +115,36 @@ class FileInfo:
     path: str
     size: int
     checksum_sha256: str
-    checksum_md5: str
+    checksum_md5: Optional[str] = None
+    checksum_blake3: Optional[str] = None
+
+
+@lru_cache(maxsize=16)
+def _get_fs(protocol: str) -> "fsspec.AbstractFileSystem":
+    """Return the process-wide fsspec backend for ``protocol``.
+
+    Sharing backends keeps sessions and connection pools alive across
+    ``Filesystem`` instances. Credentials come from the backend's usual
+    environment lookup (``AWS_PROFILE``, ``AWS_ACCESS_KEY_ID``, ...).
+    """
+    if not fsspec:  # pragma: no cover - fallback when dependency missing
+        raise RuntimeError("fsspec is required for remote paths but is not installed")
+    return fsspec.filesystem(protocol)
 
 
 class Filesystem:
-    """Thin wrapper over local filesystem and optional fsspec backends."""
+    """Thin wrapper over local filesystem and optional fsspec backends.
+
+    ``max_workers`` bounds the thread pool used for bulk checksum computation;
+    ``None`` uses one worker per CPU. hashlib releases the GIL while hashing, so
+    threads scale with cores for local trees.
+    """
 
-    def __init__(self) -> None:
-        self._fs_cache: Dict[str, "fsspec.AbstractFileSystem"] = {}
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     def _get_remote_fs(self, path: str):
-        if not fsspec:  # pragma: no cover - fallback when dependency missing
-            raise RuntimeError("fsspec is required for remote paths but is not installed")
-        parsed = urlparse(path)
-        protocol = parsed.scheme
-        if protocol in self._fs_cache:
-            return self._fs_cache[protocol]
-        fs = fsspec.filesystem(protocol)
-        self._fs_cache[protocol] = fs
-        return fs
+        return _get_fs(urlparse(path).scheme)
 
     def exists(self, path: str | Path) -> bool:
         path_str = str(path)
@@ -79,7 +165,13 @@ class Filesystem:
             Path(path_str).mkdir(parents=True, exist_ok=True)
 
     @contextmanager
-    def open(self, path: str | Path, mode: str = "rb") -> Iterator[io.IOBase]:
+    def open(self, path: str | Path, mode: str = "rb", *, buffering: int = -1) -> Iterator[io.IOBase]:
+        """Open ``path`` locally or through fsspec.
+
+        ``buffering`` sizes the local ``io.BufferedWriter``/``BufferedReader``
+        (``-1`` keeps Python's default). Remote handles buffer by fsspec block
+        size and ignore it.
+        """
         path_str = str(path)
         if "b" not in mode and "t" not in mode:
             # default to text mode with utf-8 decoding when not specified explicitly
@@ -89,8 +181,68 @@ class Filesystem:
             with fs.open(path_str, mode) as handle:
                 yield handle
         else:
-            with open(path_str, mode, encoding=None if "b" in mode else "utf-8") as handle:
+            with open(path_str, mode, buffering=buffering, encoding=None if "b" in mode else "utf-8") as handle:
+                yield handle
+
+    @contextmanager
+    def open_jsonl(self, path: str | Path) -> Iterator[LineBuffer]:
+        """Open ``path`` for writing JSONL bytes through a :class:`LineBuffer`.
+
+        Pending data is written every ~``JSONL_BUFFER_SIZE`` bytes. Local files
+        sit on an unbuffered ``FileIO``, so the LineBuffer is the only buffer
+        and each flush is a single ``write`` syscall; remote handles add
+        fsspec's block buffering on top.
+        """
+        path_str = str(path)
+        if is_remote(path_str):
+            with self.open(path_str, "wb") as handle, LineBuffer(handle, max_bytes=JSONL_BUFFER_SIZE) as lines:
+                yield lines
+        else:
+            with open(path_str, "wb", buffering=0) as raw, LineBuffer(raw, max_bytes=JSONL_BUFFER_SIZE) as lines:
+                yield lines
+
+    @contextmanager
+    def open_atomic(self, path: str | Path, *, buffering: int = -1) -> Iterator[io.IOBase]:
+        """Open ``path`` for binary writing so readers never see a partial file.
+
+        Local writes go to ``<path>.tmp.<pid>`` and are renamed over ``path``
+        with ``os.replace`` once the block exits cleanly; the temporary file is
+        removed on error. Object stores only publish an object when its upload
+        completes, so remote paths are written directly.
+        """
+        path_str = str(path)
+        if is_remote(path_str):
+            with self.open(path_str, "wb") as handle:
+                yield handle
+            return
+        tmp_path = f"{path_str}.tmp.{os.getpid()}"
+        try:
+            with open(tmp_path, "wb", buffering=buffering) as handle:
                 yield handle
+            os.replace(tmp_path, path_str)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def write_bytes(self, path: str | Path, *chunks: bytes | memoryview) -> None:
+        """Write ``chunks`` to ``path`` in order, replacing any existing file.
+
+        Meant for the one-write-per-artifact callers (frames, audio chunks):
+        local paths go straight to the builtin ``open``, skipping the
+        generator-based context manager and mode handling of :meth:`open`.
+        """
+        path_str = str(path)
+        if _is_remote_str(path_str):
+            with self.open(path_str, "wb") as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+            return
+        with open(path_str, "wb") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
 
     def remove(self, path: str | Path) -> None:
         path_str = str(path)
@@ -109,43 +261,275 @@ class Filesystem:
             for item in fs.find(path_str):
                 yield item
         else:
-            base = Path(path_str)
-            if base.is_dir():
-                for sub in base.rglob("*"):
-                    if sub.is_file():
-                        yield str(sub)
+            for _, files in _scan_tree(path_str):
+                yield from files
 
-    def compute_checksums(self, path: str | Path) -> FileInfo:
+    def compute_checksums(
+        self,
+        path: str | Path,
+        *,
+        with_md5: bool = False,
+        with_blake3: bool = False,
+    ) -> FileInfo:
         path_str = str(path)
-        sha256 = hashlib.sha256()
-        md5 = hashlib.md5()
+        if is_remote(path_str):
+            return self._compute_checksums_stream(path_str, with_md5=with_md5, with_blake3=with_blake3)
+        fd = os.open(path_str, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if not size:
+                # mmap refuses zero-length files
+                return FileInfo(
+                    path=path_str,
+                    size=0,
+                    checksum_sha256=_new_hash("sha256").hexdigest(),
+                    checksum_md5=_new_hash("md5").hexdigest() if with_md5 else None,
+                    checksum_blake3=new_blake3().hexdigest() if with_blake3 else None,
+                )
+            # the advice values are not bit flags, so each is issued separately
+            _fadvise(fd, "POSIX_FADV_SEQUENTIAL", "POSIX_FADV_WILLNEED")
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                view = memoryview(mapped)
+                try:
+                    sha256_hex, md5_hex = _digest_view(view, with_md5=with_md5)
+                    blake3_hex = new_blake3(view).hexdigest() if with_blake3 else None
+                finally:
+                    view.release()
+            # drop the pages again so a manifest pass over many large files
+            # does not evict everything else from the page cache
+            _fadvise(fd, "POSIX_FADV_DONTNEED")
+        finally:
+            os.close(fd)
+        return FileInfo(
+            path=path_str,
+            size=size,
+            checksum_sha256=sha256_hex,
+            checksum_md5=md5_hex,
+            checksum_blake3=blake3_hex,
+        )
+
+    def _compute_checksums_stream(self, path_str: str, *, with_md5: bool, with_blake3: bool) -> FileInfo:
+        hashers = [_new_hash("sha256")]
+        md5 = _new_hash("md5") if with_md5 else None
+        blake3 = new_blake3() if with_blake3 else None
+        hashers.extend(hasher for hasher in (md5, blake3) if hasher is not None)
         total = 0
+        buffer = bytearray(_READ_CHUNK_SIZE)
+        view = memoryview(buffer)
         with self.open(path_str, "rb") as handle:
-            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                total += len(chunk)
-                sha256.update(chunk)
-                md5.update(chunk)
+            if not hasattr(handle, "readinto"):  # pragma: no cover - exotic fsspec handles
+                handle = io.BufferedReader(handle)  # type: ignore[arg-type]
+            while True:
+                read = handle.readinto(buffer)
+                if not read:
+                    break
+                total += read
+                chunk = view[:read]
+                for hasher in hashers:
+                    hasher.update(chunk)
         return FileInfo(
             path=path_str,
             size=total,
-            checksum_sha256=sha256.hexdigest(),
-            checksum_md5=md5.hexdigest(),
+            checksum_sha256=hashers[0].hexdigest(),
+            checksum_md5=md5.hexdigest() if md5 is not None else None,
+            checksum_blake3=blake3.hexdigest() if blake3 is not None else None,
         )
 
+    def read_many(self, paths: Sequence[str]) -> List[Optional[bytes]]:
+        """Read whole files, preserving order; missing files read as ``None``.
+
+        Local files go through ``os.open``/``os.read`` directly, skipping the
+        buffered file object (and its fstat, isatty ioctl and seek). Remote
+        files are fetched on up to ``_REMOTE_READERS`` threads so a batch of
+        small objects costs about one round trip.
+        """
+        remote = [path for path in paths if is_remote(path)]
+        if len(remote) > 1:
+            with ThreadPoolExecutor(max_workers=min(_REMOTE_READERS, len(remote))) as executor:
+                fetched = dict(zip(remote, executor.map(self._read_remote, remote)))
+        else:
+            fetched = {path: self._read_remote(path) for path in remote}
+        return [fetched[path] if path in fetched else _read_local(path) for path in paths]
+
+    def _read_remote(self, path: str) -> Optional[bytes]:
+        try:
+            with self.open(path, "rb") as handle:
+                return handle.read()
+        except FileNotFoundError:
+            return None
+
+    def compute_checksums_many(
+        self,
+        paths: Sequence[str],
+        *,
+        with_md5: bool = False,
+        with_blake3: bool = False,
+    ) -> List[FileInfo]:
+        """Compute checksums for ``paths`` concurrently, preserving input order."""
+
+        def compute(path: str) -> FileInfo:
+            return self.compute_checksums(path, with_md5=with_md5, with_blake3=with_blake3)
+
+        if len(paths) <= 1 or self.max_workers <= 1:
+            return [compute(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths))) as executor:
+            return list(executor.map(compute, paths))
+
     def walk_local(self, path: str | Path) -> Iterator[Tuple[str, Dict[str, FileInfo]]]:
         """Walk a directory tree yielding file info dictionaries."""
         path_str = str(path)
         if is_remote(path_str):
             fs = self._get_remote_fs(path_str)
-            for file_path in fs.find(path_str):
-                yield file_path, {file_path: self.compute_checksums(file_path)}
+            file_paths = list(fs.find(path_str))
+            for file_path, info in zip(file_paths, self.compute_checksums_many(file_paths)):
+                yield file_path, {file_path: info}
         else:
-            for root, _, files in os.walk(path_str):
-                results: Dict[str, FileInfo] = {}
-                for name in files:
-                    file_path = Path(root) / name
-                    results[str(file_path)] = self.compute_checksums(file_path)
-                yield root, results
+            groups = list(_scan_tree(path_str))
+            file_paths = [name for _, names in groups for name in names]
+            infos = iter(self.compute_checksums_many(file_paths))
+            for root, names in groups:
+                yield root, {name: next(infos) for name in names}
+
+
+def _fadvise(fd: int, *advice: str) -> None:
+    """Apply ``posix_fadvise`` hints to the whole file where the platform has them."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for name in advice:
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, name))
+        except OSError:
+            # purely advisory; some filesystems reject hints
+            return
+
+
+def _read_local(path: str) -> Optional[bytes]:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    try:
+        # one byte past the size: a short read on a regular file means EOF, so
+        # a file that did not grow since fstat is read with a single call
+        request = os.fstat(fd).st_size + 1
+        chunks: List[bytes] = []
+        while True:
+            chunk = os.read(fd, request)
+            chunks.append(chunk)
+            if len(chunk) < request:
+                break
+            request = _READ_CHUNK_SIZE
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _scan_tree(path: str) -> Iterator[Tuple[str, List[str]]]:
+    """Yield ``(directory, file_paths)`` top-down using ``os.scandir``.
+
+    ``DirEntry`` type checks are answered from the readdir result on most
+    platforms, so no extra ``stat`` is issued per entry. Symlinked directories
+    are not descended into.
+    """
+    pending = [path]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        files: List[str] = []
+        subdirs: List[str] = []
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.path)
+        yield directory, files
+        pending.extend(reversed(subdirs))
+
+
+def _new_hash(name: str, data: bytes | memoryview = b""):
+    # Integrity checksums, not security: lets OpenSSL pick its fastest (SHA-NI / ARMv8) path
+    # and avoids FIPS gating of md5.
+    return hashlib.new(name, data, usedforsecurity=False)
+
+
+def new_blake3(data: bytes | memoryview = b""):
+    """Return a BLAKE3 hasher; raises when the optional ``blake3`` package is missing."""
+    if _blake3 is None:  # pragma: no cover - fallback when dependency missing
+        raise RuntimeError("blake3 is required for BLAKE3 checksums but is not installed")
+    # AUTO lets blake3 split large buffers across threads internally
+    return _blake3.blake3(data, max_threads=_blake3.blake3.AUTO)
+
+
+def _digest_view(view: memoryview, *, with_md5: bool) -> Tuple[str, Optional[str]]:
+    """Hash a mapped buffer with SHA-256 (and optionally MD5); hashlib releases the GIL."""
+    if not with_md5:
+        return _new_hash("sha256", view).hexdigest(), None
+    if len(view) < _PARALLEL_DIGEST_THRESHOLD:
+        return _new_hash("sha256", view).hexdigest(), _new_hash("md5", view).hexdigest()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        md5_future = executor.submit(lambda: _new_hash("md5", view).hexdigest())
+        sha256_hex = _new_hash("sha256", view).hexdigest()
+        return sha256_hex, md5_future.result()
+
+
+class LineBuffer:
+    """Collect encoded lines and hand them to ``handle`` in joined batches.
+
+    Used as a context manager around a binary handle; pending lines are
+    written when ``batch_size`` lines or ``max_bytes`` bytes (if set) are
+    pending, and on exit. ``handle`` may be unbuffered, in which case short
+    writes are retried.
+    """
+
+    __slots__ = ("_handle", "_lines", "_batch_size", "_max_bytes", "_pending_bytes")
+
+    def __init__(
+        self,
+        handle: io.IOBase,
+        batch_size: int = LINE_BATCH_SIZE,
+        *,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self._handle = handle
+        self._lines: List[bytes] = []
+        self._batch_size = batch_size
+        self._max_bytes = max_bytes
+        self._pending_bytes = 0
+
+    def write(self, line: bytes) -> int:
+        lines = self._lines
+        lines.append(line)
+        size = len(line)
+        self._pending_bytes += size
+        if len(lines) >= self._batch_size:
+            self.flush()
+        elif self._max_bytes is not None and self._pending_bytes >= self._max_bytes:
+            self.flush()
+        return size
+
+    def flush(self) -> None:
+        if not self._lines:
+            return
+        view = memoryview(b"".join(self._lines))
+        self._lines.clear()
+        self._pending_bytes = 0
+        while view:
+            written = self._handle.write(view)
+            if written is None or written >= len(view):
+                break
+            view = view[written:]
+
+    def __enter__(self) -> "LineBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
 
 
 def ensure_directory(fs: Filesystem, path: str | Path) -> None:
@@ -156,7 +540,13 @@ def ensure_directory(fs: Filesystem, path: str | Path) -> None:
 __all__ = [
     "Filesystem",
     "FileInfo",
+    "JSONL_BUFFER_SIZE",
+    "LINE_BATCH_SIZE",
+    "LineBuffer",
     "ensure_directory",
     "is_remote",
+    "join_local",
+    "join_remote",
     "join_uri",
+    "new_blake3",
 ]
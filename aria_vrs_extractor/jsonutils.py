@@ -0,0 +1,57 @@
+"""JSON encoding helpers backed by orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - fallback
+    orjson = None  # type: ignore
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both backends.
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(value: Any) -> Any:
+    # numpy arrays and scalars expose tolist(); mirrors orjson's OPT_SERIALIZE_NUMPY
+    tolist = getattr(value, "tolist", None)
+    if tolist is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return tolist()
+
+
+def dumps(obj: Any, *, indent: bool = False, newline: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes.
+
+    ``indent`` pretty-prints with two spaces and ``newline`` appends ``\\n``.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    text = json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        default=_default,
+    )
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+__all__ = ["JSONDecodeError", "dumps", "loads"]
@@ -2,31 +2,53 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from .jsonutils import dumps
+
+
+# ``extra=`` values are set directly on the record's ``__dict__``
+_EXTRAS = ("device_id", "recording_id", "step", "counts", "duration_ms")
 
 
 class JsonFormatter(logging.Formatter):
     """Serialize log records as JSON."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted timestamp); records within one second share the string
+        self._time_cache: Tuple[int, str] = (-1, "")
+
+    def _format_created(self, created: float) -> str:
+        second = int(created)
+        cached_second, cached_text = self._time_cache
+        if second == cached_second:
+            return cached_text
+        text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        self._time_cache = (second, text)
+        return text
+
     def format(self, record: logging.LogRecord) -> str:  # noqa: D401 - inherited docstring
         payload = {
             "level": record.levelname,
-            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(record.created)),
+            "time": self._format_created(record.created),
             "message": record.getMessage(),
         }
-        if record.args and isinstance(record.args, dict):
-            payload.update(record.args)
+        args = record.args
+        if isinstance(args, dict) and args:
+            payload.update(args)
         # propagate user supplied extras
-        for attr in ("device_id", "recording_id", "step", "counts", "duration_ms"):
-            value = getattr(record, attr, None)
+        fields = record.__dict__
+        for key in _EXTRAS:
+            value = fields.get(key)
             if value is not None:
-                payload[attr] = value
-        for key, value in getattr(record, "extra_fields", {}).items():
-            payload[key] = value
-        return json.dumps(payload, ensure_ascii=False)
+                payload[key] = value
+        extra_fields = fields.get("extra_fields")
+        if extra_fields:
+            payload.update(extra_fields)
+        return dumps(payload).decode("utf-8")
 
 
 def get_logger(name: str = "aria_vrs_extractor") -> logging.Logger:
@@ -62,14 +84,17 @@ class LogTimer:
         self.recording_id = recording_id
         self.extra = extra or {}
         self.level = level
-        self.start = 0.0
+        self.start = 0
 
     def __enter__(self) -> "LogTimer":
-        self.start = time.perf_counter()
+        self.start = time.monotonic_ns()
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:  # noqa: D401 - standard context manager signature
-        duration_ms = int((time.perf_counter() - self.start) * 1000)
+        level = logging.ERROR if exc else self.level
+        if not self.logger.isEnabledFor(level):
+            return
+        duration_ms = (time.monotonic_ns() - self.start) // 1_000_000
         msg_extra = {
             "extra_fields": self.extra,
             "step": self.step,
@@ -79,13 +104,13 @@ class LogTimer:
         }
         if exc:
             self.logger.log(
-                logging.ERROR,
+                level,
                 f"{self.message} failed: {exc}",
                 extra={**msg_extra, "error": str(exc)},
             )
         else:
             self.logger.log(
-                self.level,
+                level,
                 self.message,
                 extra=msg_extra,
             )
@@ -1,14 +1,50 @@
-"""Operations implemented by aria_vrs_extractor."""
-
-from .rgb import extract_rgb
-from .et import extract_et
-from .audio import extract_audio
-from .imu import extract_imu
-from .gps import extract_gps
-from .wifi import extract_wifi
-from .bt import extract_bluetooth
-from .events import merge_events
-from .manifest import write_manifest
+"""Operations implemented by aria_vrs_extractor.
+
+Submodules are imported on first attribute access (PEP 562) so that text-only
+steps such as ``merge_events`` do not pull in projectaria_tools, numpy or Pillow.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .audio import extract_audio
+    from .bt import extract_bluetooth
+    from .et import extract_et
+    from .events import merge_events
+    from .gps import extract_gps
+    from .imu import extract_imu
+    from .manifest import write_manifest
+    from .rgb import extract_rgb
+    from .wifi import extract_wifi
+
+_LAZY = {
+    "extract_rgb": "rgb",
+    "extract_et": "et",
+    "extract_audio": "audio",
+    "extract_imu": "imu",
+    "extract_gps": "gps",
+    "extract_wifi": "wifi",
+    "extract_bluetooth": "bt",
+    "merge_events": "events",
+    "write_manifest": "manifest",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "extract_rgb",
@@ -0,0 +1,54 @@
+"""Helpers shared by the record-per-line extractors."""
+
+from __future__ import annotations
+
+from operator import attrgetter, methodcaller
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+FieldSpec = Sequence[Tuple[str, str]]
+
+
+def bind_fields(sample: Any, fields: FieldSpec) -> Callable[[Any], Dict[str, Any]]:
+    """Build a reader mapping payload keys to attributes of records shaped like ``sample``.
+
+    ``fields`` lists ``(payload_key, attribute)`` pairs. Attributes missing on
+    ``sample`` read as ``None``, like ``getattr(record, attribute, None)``.
+    Streams are homogeneous, so the check is done once per stream and each
+    record then goes through a single ``attrgetter`` call.
+    """
+    template: Dict[str, Any] = dict.fromkeys(key for key, _ in fields)
+    present = [(key, attr) for key, attr in fields if hasattr(sample, attr)]
+    if not present:
+        return lambda record: template.copy()
+    keys = tuple(key for key, _ in present)
+    getter = attrgetter(*(attr for _, attr in present))
+    if len(present) == 1:
+        (key,) = keys
+
+        def read_one(record: Any) -> Dict[str, Any]:
+            row = template.copy()
+            row[key] = getter(record)
+            return row
+
+        return read_one
+
+    def read(record: Any) -> Dict[str, Any]:
+        row = template.copy()
+        row.update(zip(keys, getter(record)))
+        return row
+
+    return read
+
+
+def bind_time_reader(sample: Any, domain: Any) -> Callable[[Any], int]:
+    """Return a ``data -> int`` reader for ``data.get_time_ns(domain)``.
+
+    The bindings normally return a Python ``int`` already, in which case the
+    reader is a bare ``methodcaller`` and skips the ``int()`` conversion.
+    """
+    if type(sample.get_time_ns(domain)) is int:
+        return methodcaller("get_time_ns", domain)
+    return lambda data: int(data.get_time_ns(domain))
+
+
+__all__ = ["FieldSpec", "bind_fields", "bind_time_reader"]
@@ -2,23 +2,75 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import wave
-from typing import Dict, List
+import struct
+from contextlib import ExitStack
+from functools import partial
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from _core_pybinds.sensor_data import TimeDomain
 
+from ..concurrency import OrderedTaskPool
 from ..config import ExtractorConfig
 from ..constants import SENSOR_FILES
-from ..io import Filesystem, ensure_directory, join_uri
+from ..io import Filesystem, ensure_directory, is_remote
+from ..jsonutils import dumps
 from ..logger import LogTimer
 from ..paths import OutputLayout
 from ..provider import AriaVrsProvider
 from ..quality import QualityFlagger
 from ..status import clear_done, is_done, mark_done
+from ._common import bind_time_reader
+
+# WAV chunks are small; a few writer threads are enough to hide storage latency.
+_WAV_WRITERS = 4
+
+INT32_MAX = np.iinfo(np.int32).max
+INT32_MIN = np.iinfo(np.int32).min
+
+
+def _as_int32_samples(data: object) -> np.ndarray:
+    """View audio samples as int32 without a per-element copy when ``data`` is a buffer."""
+    try:
+        view = memoryview(data)  # type: ignore[arg-type]
+    except TypeError:
+        # plain Python sequences, e.g. the list projectaria_tools returns
+        return np.asarray(data, dtype=np.int32)
+    if view.format in ("B", "b", "c"):
+        # untyped bytes holding packed samples
+        return np.frombuffer(view, dtype=np.int32)
+    return np.asarray(view).astype(np.int32, copy=False)
+
+
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_SAMPLE_WIDTH = 4  # 32-bit samples
+
+
+def _build_wav_header(sample_rate: int, num_channels: int, data_size: int) -> bytes:
+    """Return the 44-byte canonical PCM RIFF/WAVE header for ``data_size`` payload bytes."""
+    block_align = num_channels * _SAMPLE_WIDTH
+    return _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        num_channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        _SAMPLE_WIDTH * 8,
+        b"data",
+        data_size,
+    )
+
+
+def _pcm_view(samples: np.ndarray) -> memoryview:
+    # WAV PCM is little-endian; on little-endian hosts this is a view, not a copy
+    return memoryview(np.ascontiguousarray(samples, dtype="<i4").view(np.uint8))
 
 
 def _write_wav(
@@ -27,18 +79,78 @@ def _write_wav(
     *,
     sample_rate: int,
     num_channels: int,
-    payload: bytes,
+    samples: np.ndarray,
 ) -> int:
-    parent = uri.rsplit("/", 1)[0] if "/" in uri else ""
-    if parent:
-        ensure_directory(fs, parent)
-    with fs.open(uri, "wb") as handle:
-        with wave.open(handle, "wb") as wav_file:
-            wav_file.setnchannels(num_channels)
-            wav_file.setsampwidth(4)  # 32-bit samples
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(payload)
-    return len(payload)
+    # the caller creates layout.audio_dir once before the first chunk
+    payload = _pcm_view(samples)
+    fs.write_bytes(uri, _build_wav_header(sample_rate, num_channels, payload.nbytes), payload)
+    return payload.nbytes
+
+
+# RIFF sizes are 32-bit; leave room for the 36 header bytes counted in the RIFF size
+_WAV_MAX_DATA_BYTES = 0xFFFFFFFF - 36
+
+
+class _RollingWavWriter:
+    """Append PCM chunks to ``audio.wav`` and report where each one landed.
+
+    The header is written with zero sizes and patched with one seek on
+    :meth:`close`, so this only works for local files. A recording that would
+    overflow the 4 GiB RIFF limit continues in ``audio_001.wav``, ``audio_002.wav``...
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        join: Callable[..., str],
+        *,
+        sample_rate: int,
+        num_channels: int,
+    ) -> None:
+        self.directory = directory
+        self.join = join
+        self.sample_rate = sample_rate
+        self.num_channels = num_channels
+        self.segment = -1
+        self.uri = ""
+        self.data_bytes = 0
+        self._handle: Optional[BinaryIO] = None
+
+    def _roll(self) -> None:
+        self._finalize()
+        self.segment += 1
+        name = "audio.wav" if self.segment == 0 else f"audio_{self.segment:03d}.wav"
+        self.uri = self.join(self.directory, name)
+        self.data_bytes = 0
+        self._handle = open(self.uri, "wb")
+        self._handle.write(_build_wav_header(self.sample_rate, self.num_channels, 0))
+
+    def _finalize(self) -> None:
+        if self._handle is None:
+            return
+        self._handle.seek(0)
+        self._handle.write(_build_wav_header(self.sample_rate, self.num_channels, self.data_bytes))
+        self._handle.close()
+        self._handle = None
+
+    def append(self, samples: np.ndarray) -> Tuple[str, int, int]:
+        """Write ``samples`` and return ``(uri, offset_bytes, length_bytes)``."""
+        payload = _pcm_view(samples)
+        if self._handle is None or self.data_bytes + payload.nbytes > _WAV_MAX_DATA_BYTES:
+            self._roll()
+        offset = _WAV_HEADER.size + self.data_bytes
+        self._handle.write(payload)  # type: ignore[union-attr]
+        self.data_bytes += payload.nbytes
+        return self.uri, offset, payload.nbytes
+
+    def close(self) -> None:
+        self._finalize()
+
+    def __enter__(self) -> "_RollingWavWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
 
 def extract_audio(
@@ -50,6 +162,7 @@ def extract_audio(
     vrs_path: str,
     force: bool,
     logger: logging.Logger,
+    provider: Optional[AriaVrsProvider] = None,
 ) -> None:
     if not config.audio.export:
         logger.info(
@@ -72,13 +185,16 @@ def extract_audio(
     ensure_directory(fs, layout.audio_dir)
     ensure_directory(fs, layout.sensors_dir)
 
-    provider = AriaVrsProvider(vrs_path)
+    provider = provider or AriaVrsProvider(vrs_path)
     audio_stream = provider.resolve_audio_stream()
     config_record = provider.provider.get_audio_configuration(audio_stream.stream_id)
     sample_rate = int(getattr(config_record, "sample_rate", 48000))
     num_channels = int(getattr(config_record, "num_channels", 7))
 
     jsonl_path = layout.sensor_file(SENSOR_FILES["audio"])
+    single_file = config.audio.layout == "single"
+    if single_file and is_remote(layout.audio_dir):
+        raise ValueError("audio.layout 'single' patches the WAV header in place and needs a local output root")
 
     summary: Dict[str, object] = {
         "sensor": "mic",
@@ -99,7 +215,8 @@ def extract_audio(
     }
     artifact = summary["artifacts"][0]  # type: ignore[index]
 
-    enabled_flags = {flag for flag in quality_flagger.enabled_flags}
+    enabled_flags = frozenset(quality_flagger.enabled_flags)
+    evaluate_flags = quality_flagger.compile("mic")
 
     with LogTimer(
         logger,
@@ -109,66 +226,103 @@ def extract_audio(
         recording_id=config.recording_id,
         extra={"stream": audio_stream.numeric_name, "jsonl": jsonl_path},
     ):
-        with fs.open(jsonl_path, "wt") as jsonl_file:
-            iterator = provider.deliver_stream([audio_stream.stream_id])
-            chunk_index = 0
-            for data in iterator:
-                audio_data, record = data.audio_data_and_record()
-                if not audio_data.data:
-                    continue
-
-                payload_array = np.array(audio_data.data, dtype=np.int32)
-                try:
-                    sample_count = len(payload_array) // num_channels
-                except ZeroDivisionError:  # pragma: no cover - defensive
-                    continue
-
-                chunk_samples = sample_count
-                expected_samples = config.audio.chunk_samples
-                if expected_samples and chunk_samples != expected_samples:
-                    logger.warning(
-                        "Audio chunk sample count %s differs from requested %s",
-                        chunk_samples,
-                        expected_samples,
-                    )
-
-                chunk_bytes = _write_wav(
-                    fs,
-                    join_uri(layout.audio_dir, f"chunk_{chunk_index:06d}.wav"),
-                    sample_rate=sample_rate,
-                    num_channels=num_channels,
-                    payload=payload_array.tobytes(),
-                )
-                clip_uri = join_uri(layout.audio_dir, f"chunk_{chunk_index:06d}.wav")
-                chunk_index += 1
+        with fs.open_jsonl(jsonl_path) as jsonl_file:
 
+            def finish_chunk(line: bytes, chunk_bytes: int) -> None:
+                # runs on this thread, in chunk order, once the WAV file is written
                 summary["bytes"] = int(summary["bytes"]) + chunk_bytes  # type: ignore[arg-type]
                 summary["count"] = int(summary["count"]) + 1  # type: ignore[arg-type]
                 artifact["bytes"] = int(artifact["bytes"]) + chunk_bytes
                 artifact["count"] = int(artifact["count"]) + 1
+                jsonl_file.write(line)
+
+            with OrderedTaskPool(_WAV_WRITERS) as writers, ExitStack() as stack:
+                rolling = (
+                    stack.enter_context(
+                        _RollingWavWriter(
+                            layout.audio_dir,
+                            layout.join,
+                            sample_rate=sample_rate,
+                            num_channels=num_channels,
+                        )
+                    )
+                    if single_file
+                    else None
+                )
+                # join once; each chunk then only formats its index onto the prefix
+                clip_prefix = layout.join(layout.audio_dir, "chunk_")
+                iterator = provider.deliver_stream([audio_stream.stream_id])
+                chunk_index = 0
+                read_ts = None
+                for data in iterator:
+                    audio_data, record = data.audio_data_and_record()
+                    if not audio_data.data:
+                        continue
+
+                    payload_array = _as_int32_samples(audio_data.data)
+                    try:
+                        sample_count = len(payload_array) // num_channels
+                    except ZeroDivisionError:  # pragma: no cover - defensive
+                        continue
+
+                    chunk_samples = sample_count
+                    expected_samples = config.audio.chunk_samples
+                    if expected_samples and chunk_samples != expected_samples:
+                        logger.warning(
+                            "Audio chunk sample count %s differs from requested %s",
+                            chunk_samples,
+                            expected_samples,
+                        )
+
+                    if rolling is None:
+                        clip_uri = f"{clip_prefix}{chunk_index:06d}.wav"
+                    chunk_index += 1
+
+                    if read_ts is None:
+                        read_ts = bind_time_reader(data, TimeDomain.DEVICE_TIME)
+                    device_ts = read_ts(data)
+                    summary["ts_first"] = device_ts if summary["ts_first"] is None else min(summary["ts_first"], device_ts)  # type: ignore[arg-type]
+                    summary["ts_last"] = device_ts if summary["ts_last"] is None else max(summary["ts_last"], device_ts)  # type: ignore[arg-type]
+
+                    duration_ns = chunk_samples * 1_000_000_000 // sample_rate
+                    duration_ms = duration_ns / 1_000_000
+
+                    # max/min avoid the temporary np.abs would allocate; np.abs also
+                    # wraps INT32_MIN back to itself, so negative clipping was missed
+                    clipping = bool(payload_array.max() >= INT32_MAX or payload_array.min() <= INT32_MIN)
+
+                    if rolling is not None:
+                        # sequential appends to one file; nothing to gain from the pool
+                        clip_uri, offset_bytes, length_bytes = rolling.append(payload_array)
+
+                    payload = {
+                        "ts_ns": device_ts,
+                        "sensor": "mic",
+                        "clip_uri": clip_uri,
+                        "duration_ms": duration_ms,
+                        "channels": num_channels,
+                        "chunk_samples": chunk_samples,
+                        "stream_id": audio_stream.numeric_name,
+                    }
+                    if rolling is not None:
+                        payload["offset_bytes"] = offset_bytes
+                        payload["length_bytes"] = length_bytes
+                    flags: List[str] = evaluate_flags(payload, payload_array)
+                    if clipping and "audio_clipping" in enabled_flags and "audio_clipping" not in flags:
+                        flags.append("audio_clipping")
+                    payload["quality_flags"] = flags
+
+                    if rolling is not None:
+                        finish_chunk(dumps(payload, newline=True), length_bytes)
+                        continue
+                    writers.submit(
+                        _write_wav,
+                        fs,
+                        clip_uri,
+                        sample_rate=sample_rate,
+                        num_channels=num_channels,
+                        samples=payload_array,
+                        on_result=partial(finish_chunk, dumps(payload, newline=True)),
+                    )
 
-                device_ts = int(data.get_time_ns(TimeDomain.DEVICE_TIME))
-                summary["ts_first"] = device_ts if summary["ts_first"] is None else min(summary["ts_first"], device_ts)  # type: ignore[arg-type]
-                summary["ts_last"] = device_ts if summary["ts_last"] is None else max(summary["ts_last"], device_ts)  # type: ignore[arg-type]
-
-                duration_ns = int(chunk_samples / sample_rate * 1_000_000_000)
-                duration_ms = duration_ns / 1_000_000
-
-                clipping = bool(np.max(np.abs(payload_array)) >= np.iinfo(np.int32).max)
-
-                payload = {
-                    "ts_ns": device_ts,
-                    "sensor": "mic",
-                    "clip_uri": clip_uri,
-                    "duration_ms": duration_ms,
-                    "channels": num_channels,
-                    "chunk_samples": chunk_samples,
-                    "stream_id": audio_stream.numeric_name,
-                }
-                flags: List[str] = quality_flagger.evaluate(payload)
-                if clipping and "audio_clipping" in enabled_flags and "audio_clipping" not in flags:
-                    flags.append("audio_clipping")
-                payload["quality_flags"] = flags
-                jsonl_file.write(json.dumps(payload, ensure_ascii=False) + "\n")
-
-    mark_done(fs, layout.root, step_name, json.dumps(summary, ensure_ascii=False))
+    mark_done(fs, layout.root, step_name, dumps(summary))
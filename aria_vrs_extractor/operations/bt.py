@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
 from _core_pybinds.sensor_data import TimeDomain
 
 from ..config import ExtractorConfig
 from ..constants import SENSOR_FILES
 from ..io import Filesystem
+from ..jsonutils import dumps
 from ..logger import LogTimer
 from ..paths import OutputLayout
 from ..provider import AriaVrsProvider
 from ..quality import QualityFlagger
 from ..status import clear_done, is_done, mark_done
+from ._common import bind_fields, bind_time_reader
+
+# (payload key, record attribute)
+_BT_FIELDS = (
+    ("beacon_id", "unique_id"),
+    ("rssi", "rssi"),
+    ("tx_power", "tx_power"),
+    ("freq_mhz", "freq_mhz"),
+)
 
 
 def extract_bluetooth(
@@ -27,6 +36,7 @@ def extract_bluetooth(
     vrs_path: str,
     force: bool,
     logger: logging.Logger,
+    provider: Optional[AriaVrsProvider] = None,
 ) -> None:
     if not config.bt.export:
         logger.info(
@@ -46,7 +56,7 @@ def extract_bluetooth(
     if force:
         clear_done(fs, layout.root, step_name)
 
-    provider = AriaVrsProvider(vrs_path)
+    provider = provider or AriaVrsProvider(vrs_path)
     bt_streams = provider.resolve_bt_streams()
     if not bt_streams:
         logger.warning(
@@ -67,6 +77,8 @@ def extract_bluetooth(
         "streams": [info.numeric_name for info in bt_streams],
     }
 
+    evaluate_flags = quality_flagger.compile("bt")
+
     with LogTimer(
         logger,
         "Bluetooth extraction completed",
@@ -75,12 +87,16 @@ def extract_bluetooth(
         recording_id=config.recording_id,
         extra={"streams": summary["streams"], "jsonl": jsonl_path},
     ):
-        with fs.open(jsonl_path, "wt") as jsonl_file:
+        with fs.open_jsonl(jsonl_path) as jsonl_file:
             for info in bt_streams:
+                read_fields = read_ts = None
                 iterator = provider.deliver_stream([info.stream_id])
                 for data in iterator:
                     bt = data.bluetooth_data()
-                    ts_ns = int(data.get_time_ns(TimeDomain.DEVICE_TIME))
+                    if read_fields is None:
+                        read_fields = bind_fields(bt, _BT_FIELDS)
+                        read_ts = bind_time_reader(data, TimeDomain.DEVICE_TIME)
+                    ts_ns = read_ts(data)
                     summary["ts_first"] = ts_ns if summary["ts_first"] is None else min(summary["ts_first"], ts_ns)  # type: ignore[arg-type]
                     summary["ts_last"] = ts_ns if summary["ts_last"] is None else max(summary["ts_last"], ts_ns)  # type: ignore[arg-type]
 
@@ -88,16 +104,13 @@ def extract_bluetooth(
                         "ts_ns": ts_ns,
                         "sensor": "bt",
                         "stream_id": info.numeric_name,
-                        "beacon_id": getattr(bt, "unique_id", None),
-                        "rssi": getattr(bt, "rssi", None),
-                        "tx_power": getattr(bt, "tx_power", None),
-                        "freq_mhz": getattr(bt, "freq_mhz", None),
+                        **read_fields(bt),
                     }
-                    payload["quality_flags"] = quality_flagger.evaluate(payload)
+                    payload["quality_flags"] = evaluate_flags(payload)
 
-                    record = json.dumps(payload, ensure_ascii=False)
-                    jsonl_file.write(record + "\n")
+                    record = dumps(payload, newline=True)
+                    jsonl_file.write(record)
                     summary["count"] = int(summary["count"]) + 1  # type: ignore[arg-type]
-                    summary["bytes"] = int(summary["bytes"]) + len(record) + 1
+                    summary["bytes"] = int(summary["bytes"]) + len(record)  # type: ignore[arg-type]
 
-    mark_done(fs, layout.root, step_name, json.dumps(summary, ensure_ascii=False))
+    mark_done(fs, layout.root, step_name, dumps(summary))
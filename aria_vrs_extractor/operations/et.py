@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-import io
-import json
 import logging
-from typing import Dict
+import os
+from functools import partial
+from typing import Dict, Optional
 
 import numpy as np
-from PIL import Image
 
+from ..concurrency import OrderedTaskPool
 from ..config import ExtractorConfig
 from ..constants import SENSOR_FILES
-from ..io import Filesystem, ensure_directory, join_uri
+from ..imaging import encode_jpeg, resize
+from ..io import Filesystem, ensure_directory
+from ..jsonutils import dumps
 from ..logger import LogTimer
 from ..paths import OutputLayout
 from ..provider import AriaVrsProvider, StreamInfo
@@ -21,14 +23,9 @@ from ..status import clear_done, is_done, mark_done
 
 
 def _save_eye_frame(fs: Filesystem, array: np.ndarray, uri: str) -> int:
-    buffer = io.BytesIO()
-    Image.fromarray(array).save(buffer, format="JPEG", quality=95)
-    payload = buffer.getvalue()
-    parent = uri.rsplit("/", 1)[0] if "/" in uri else ""
-    if parent:
-        ensure_directory(fs, parent)
-    with fs.open(uri, "wb") as handle:
-        handle.write(payload)
+    payload = encode_jpeg(array, quality=95)
+    # extract_et creates every selected eye directory before the first frame
+    fs.write_bytes(uri, payload)
     return len(payload)
 
 
@@ -41,6 +38,7 @@ def extract_et(
     vrs_path: str,
     force: bool,
     logger: logging.Logger,
+    provider: Optional[AriaVrsProvider] = None,
 ) -> None:
     if not config.et.export:
         logger.info(
@@ -60,7 +58,7 @@ def extract_et(
     if force:
         clear_done(fs, layout.root, step_name)
 
-    provider = AriaVrsProvider(vrs_path)
+    provider = provider or AriaVrsProvider(vrs_path)
     discovered = provider.resolve_et_streams()
 
     selection: Dict[str, StreamInfo] = {}
@@ -113,6 +111,8 @@ def extract_et(
         "artifacts": artifacts,
     }
 
+    evaluate_flags = quality_flagger.compile("et")
+
     with LogTimer(
         logger,
         "ET extraction completed",
@@ -121,49 +121,62 @@ def extract_et(
         recording_id=config.recording_id,
         extra={"streams": [info.numeric_name for info in selection.values()], "jsonl": jsonl_path},
     ):
-        with fs.open(jsonl_path, "wt") as jsonl_file:
-            for eye, info in selection.items():
-                output_dir = dir_map[eye]
-                artifact = next(item for item in artifacts if item["stream_id"] == info.numeric_name)
-                iterator = provider.deliver_stream([info.stream_id])
-                for data in iterator:
-                    image, record = data.image_data_and_record()
-                    if not image.is_valid():
-                        continue
-                    array = image.to_numpy_array()
-                    if config.et.downscale:
-                        width, height = config.et.downscale
-                        array = np.array(Image.fromarray(array).resize((width, height), resample=Image.BILINEAR))
-                    height_px, width_px = array.shape[:2]
-
-                    record_frame = getattr(record, "frame_number", None)
-                    frame_id = int(record_frame) if record_frame is not None else int(summary["count"])  # type: ignore[arg-type]
-                    filename = f"frame_{frame_id:06d}.jpg"
-                    frame_uri = join_uri(output_dir, filename)
-
-                    bytes_written = _save_eye_frame(fs, array, frame_uri)
-                    summary["bytes"] = int(summary["bytes"]) + bytes_written  # type: ignore[arg-type]
-                    summary["count"] = int(summary["count"]) + 1  # type: ignore[arg-type]
-                    artifact["bytes"] = int(artifact["bytes"]) + bytes_written
-                    artifact["count"] = int(artifact["count"]) + 1
-
-                    ts_ns = int(getattr(record, "capture_timestamp_ns"))
-                    summary["ts_first"] = ts_ns if summary["ts_first"] is None else min(summary["ts_first"], ts_ns)  # type: ignore[arg-type]
-                    summary["ts_last"] = ts_ns if summary["ts_last"] is None else max(summary["ts_last"], ts_ns)  # type: ignore[arg-type]
-
-                    payload = {
-                        "ts_ns": ts_ns,
-                        "sensor": "et",
-                        "eye": eye,
-                        "frame_id": frame_id,
-                        "uri": frame_uri,
-                        "width": int(width_px),
-                        "height": int(height_px),
-                        "stream_id": info.numeric_name,
-                        "gaze_vector": getattr(record, "gaze_vector", None),
-                        "confidence": getattr(record, "gaze_confidence", None),
-                    }
-                    payload["quality_flags"] = quality_flagger.evaluate(payload)
-                    jsonl_file.write(json.dumps(payload, ensure_ascii=False) + "\n")
-
-    mark_done(fs, layout.root, step_name, json.dumps(summary, ensure_ascii=False))
+        with fs.open_jsonl(jsonl_path) as jsonl_file:
+
+            def finish_frame(artifact: Dict[str, object], line: bytes, bytes_written: int) -> None:
+                # runs on this thread, in frame order, once the JPEG is written
+                summary["bytes"] = int(summary["bytes"]) + bytes_written  # type: ignore[arg-type]
+                summary["count"] = int(summary["count"]) + 1  # type: ignore[arg-type]
+                artifact["bytes"] = int(artifact["bytes"]) + bytes_written  # type: ignore[arg-type]
+                artifact["count"] = int(artifact["count"]) + 1  # type: ignore[arg-type]
+                jsonl_file.write(line)
+
+            frames_submitted = 0
+            with OrderedTaskPool(os.cpu_count() or 1) as encoders:
+                for eye, info in selection.items():
+                    output_dir = dir_map[eye]
+                    artifact = next(item for item in artifacts if item["stream_id"] == info.numeric_name)
+                    iterator = provider.deliver_stream([info.stream_id])
+                    for data in iterator:
+                        image, record = data.image_data_and_record()
+                        if not image.is_valid():
+                            continue
+                        array = image.to_numpy_array()
+                        if config.et.downscale:
+                            downscale = config.et.downscale
+                            array = resize(array, downscale.w, downscale.h)
+                        height_px, width_px = array.shape[:2]
+
+                        record_frame = getattr(record, "frame_number", None)
+                        frame_id = int(record_frame) if record_frame is not None else frames_submitted
+                        filename = f"frame_{frame_id:06d}.jpg"
+                        frame_uri = layout.join(output_dir, filename)
+                        frames_submitted += 1
+
+                        ts_ns = int(getattr(record, "capture_timestamp_ns"))
+                        summary["ts_first"] = ts_ns if summary["ts_first"] is None else min(summary["ts_first"], ts_ns)  # type: ignore[arg-type]
+                        summary["ts_last"] = ts_ns if summary["ts_last"] is None else max(summary["ts_last"], ts_ns)  # type: ignore[arg-type]
+
+                        payload = {
+                            "ts_ns": ts_ns,
+                            "sensor": "et",
+                            "eye": eye,
+                            "frame_id": frame_id,
+                            "uri": frame_uri,
+                            "width": int(width_px),
+                            "height": int(height_px),
+                            "stream_id": info.numeric_name,
+                            "gaze_vector": getattr(record, "gaze_vector", None),
+                            "confidence": getattr(record, "gaze_confidence", None),
+                        }
+                        payload["quality_flags"] = evaluate_flags(payload, array)
+
+                        encoders.submit(
+                            _save_eye_frame,
+                            fs,
+                            array,
+                            frame_uri,
+                            on_result=partial(finish_frame, artifact, dumps(payload, newline=True)),
+                        )
+
+    mark_done(fs, layout.root, step_name, dumps(summary))
@@ -3,44 +3,46 @@
 from __future__ import annotations
 
 import heapq
-import json
 import logging
-from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Tuple
+import re
+from operator import itemgetter
+from typing import Iterator, List, Optional, Tuple
 
-from ..constants import DONE_DIRNAME, EVENTS_FILE
-from ..io import Filesystem, ensure_directory, is_remote, join_uri
+from ..constants import EVENTS_FILE
+from ..io import Filesystem, ensure_directory, join_uri
+from ..jsonutils import JSONDecodeError, dumps, loads
 from ..logger import LogTimer
-from ..status import clear_done, is_done, mark_done, step_done_path
+from ..status import clear_done, done_steps, is_done, mark_done, read_summaries
 
 
-def _read_done_summary(fs: Filesystem, path: str) -> Optional[Dict]:
-    if not fs.exists(path):
+# Extractors write ``ts_ns`` as the first key, so most lines never need a full parse.
+_TS_PREFIX_RE = re.compile(rb'^\{\s*"ts_ns"\s*:\s*(-?\d+)\s*[,}]')
+
+
+def _line_timestamp(line: bytes) -> Optional[int]:
+    if line.endswith(b"}"):
+        match = _TS_PREFIX_RE.match(line)
+        if match:
+            return int(match.group(1))
+    try:
+        payload = loads(line)
+    except JSONDecodeError:
         return None
-    with fs.open(path, "rt") as handle:
-        content = handle.read().strip()
-        if not content:
-            return None
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            return None
-
-
-def _iter_jsonl(fs: Filesystem, path: str) -> Iterator[Tuple[int, Dict]]:
-    with fs.open(path, "rt") as handle:
+    ts = payload.get("ts_ns") if isinstance(payload, dict) else None
+    return None if ts is None else int(ts)
+
+
+def _iter_jsonl(fs: Filesystem, path: str) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(ts_ns, raw_line)`` for each record; lines are passed through unparsed."""
+    with fs.open(path, "rb") as handle:
         for line in handle:
             line = line.strip()
             if not line:
                 continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            ts = payload.get("ts_ns")
+            ts = _line_timestamp(line)
             if ts is None:
                 continue
-            yield int(ts), payload
+            yield ts, line + b"\n"
 
 
 def merge_events(
@@ -61,7 +63,6 @@ def merge_events(
     if force:
         clear_done(fs, root, step_name)
 
-    done_dir = join_uri(root, DONE_DIRNAME)
     candidate_steps = [
         "extract_rgb",
         "extract_et",
@@ -72,12 +73,9 @@ def merge_events(
         "extract_bt",
     ]
 
-    sensor_files: List[str] = []
-    for step in candidate_steps:
-        marker_path = join_uri(done_dir, f"{step}.done")
-        summary = _read_done_summary(fs, marker_path)
-        if summary and "jsonl" in summary:
-            sensor_files.append(summary["jsonl"])
+    present = done_steps(fs, root)
+    summaries = read_summaries(fs, root, (step for step in candidate_steps if step in present))
+    sensor_files: List[str] = [summary["jsonl"] for summary in summaries.values() if "jsonl" in summary]
 
     if not sensor_files:
         logger.warning("No sensor JSONL files discovered for event merge", extra={"root": root})
@@ -94,21 +92,9 @@ def merge_events(
     if force and fs.exists(events_path):
         fs.remove(events_path)
 
-    def initial_entry(idx: int, iterator: Iterator[Tuple[int, Dict]]):
-        try:
-            ts, payload = next(iterator)
-        except StopIteration:
-            return None
-        return (ts, idx, payload, iterator)
-
-    iterators: List[Iterator[Tuple[int, Dict]]] = [
+    iterators: List[Iterator[Tuple[int, bytes]]] = [
         _iter_jsonl(fs, path) for path in sensor_files
     ]
-    heap: List[Tuple[int, int, Dict, Iterator[Tuple[int, Dict]]]] = []
-    for idx, iterator in enumerate(iterators):
-        entry = initial_entry(idx, iterator)
-        if entry:
-            heapq.heappush(heap, entry)
 
     summary = {
         "sensor": "events",
@@ -127,15 +113,12 @@ def merge_events(
         recording_id=None,
         extra={"events": events_path},
     ):
-        with fs.open(events_path, "wt") as output:
-            while heap:
-                ts, idx, payload, iterator = heapq.heappop(heap)
+        with fs.open_jsonl(events_path) as output:
+            # heapq.merge is stable, so equal timestamps keep the sensor_files order
+            for ts, line in heapq.merge(*iterators, key=itemgetter(0)):
                 summary["count"] = int(summary["count"]) + 1
                 summary["ts_first"] = ts if summary["ts_first"] is None else min(summary["ts_first"], ts)
                 summary["ts_last"] = ts if summary["ts_last"] is None else max(summary["ts_last"], ts)
-                output.write(json.dumps(payload, ensure_ascii=False) + "\n")
-                next_entry = initial_entry(idx, iterator)
-                if next_entry:
-                    heapq.heappush(heap, next_entry)
+                output.write(line)
 
-    mark_done(fs, root, step_name, json.dumps(summary, ensure_ascii=False))
+    mark_done(fs, root, step_name, dumps(summary))
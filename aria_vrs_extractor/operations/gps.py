@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
 from _core_pybinds.sensor_data import TimeDomain
 
 from ..config import ExtractorConfig
 from ..constants import SENSOR_FILES
 from ..io import Filesystem
+from ..jsonutils import dumps
 from ..logger import LogTimer
 from ..paths import OutputLayout
 from ..provider import AriaVrsProvider
 from ..quality import QualityFlagger
 from ..status import clear_done, is_done, mark_done
+from ._common import bind_fields, bind_time_reader
+
+# (payload key, record attribute)
+_GPS_FIELDS = (
+    ("lat", "latitude"),
+    ("lon", "longitude"),
+    ("alt", "altitude"),
+    ("fix", "provider"),
+    ("speed", "speed"),
+    ("accuracy", "accuracy"),
+)
 
 
 def extract_gps(
@@ -27,6 +38,7 @@ def extract_gps(
     vrs_path: str,
     force: bool,
     logger: logging.Logger,
+    provider: Optional[AriaVrsProvider] = None,
 ) -> None:
     if not config.gps.export:
         logger.info(
@@ -46,7 +58,7 @@ def extract_gps(
     if force:
         clear_done(fs, layout.root, step_name)
 
-    provider = AriaVrsProvider(vrs_path)
+    provider = provider or AriaVrsProvider(vrs_path)
     gps_streams = provider.resolve_gps_streams()
     if not gps_streams:
         logger.warning(
@@ -67,6 +79,8 @@ def extract_gps(
         "streams": [info.numeric_name for info in gps_streams],
     }
 
+    evaluate_flags = quality_flagger.compile("gps")
+
     with LogTimer(
         logger,
         "GPS extraction completed",
@@ -75,12 +89,16 @@ def extract_gps(
         recording_id=config.recording_id,
         extra={"streams": summary["streams"], "jsonl": jsonl_path},
     ):
-        with fs.open(jsonl_path, "wt") as jsonl_file:
+        with fs.open_jsonl(jsonl_path) as jsonl_file:
             for info in gps_streams:
+                read_fields = read_ts = None
                 iterator = provider.deliver_stream([info.stream_id])
                 for data in iterator:
                     gps = data.gps_data()
-                    ts_ns = int(data.get_time_ns(TimeDomain.DEVICE_TIME))
+                    if read_fields is None:
+                        read_fields = bind_fields(gps, _GPS_FIELDS)
+                        read_ts = bind_time_reader(data, TimeDomain.DEVICE_TIME)
+                    ts_ns = read_ts(data)
                     summary["ts_first"] = ts_ns if summary["ts_first"] is None else min(summary["ts_first"], ts_ns)  # type: ignore[arg-type]
                     summary["ts_last"] = ts_ns if summary["ts_last"] is None else max(summary["ts_last"], ts_ns)  # type: ignore[arg-type]
 
@@ -88,18 +106,13 @@ def extract_gps(
                         "ts_ns": ts_ns,
                         "sensor": "gps",
                         "stream_id": info.numeric_name,
-                        "lat": getattr(gps, "latitude", None),
-                        "lon": getattr(gps, "longitude", None),
-                        "alt": getattr(gps, "altitude", None),
-                        "fix": getattr(gps, "provider", None),
-                        "speed": getattr(gps, "speed", None),
-                        "accuracy": getattr(gps, "accuracy", None),
+                        **read_fields(gps),
                     }
-                    payload["quality_flags"] = quality_flagger.evaluate(payload)
+                    payload["quality_flags"] = evaluate_flags(payload)
 
-                    record = json.dumps(payload, ensure_ascii=False)
-                    jsonl_file.write(record + "\n")
+                    record = dumps(payload, newline=True)
+                    jsonl_file.write(record)
                     summary["count"] = int(summary["count"]) + 1  # type: ignore[arg-type]
-                    summary["bytes"] = int(summary["bytes"]) + len(record) + 1
+                    summary["bytes"] = int(summary["bytes"]) + len(record)  # type: ignore[arg-type]
 
-    mark_done(fs, layout.root, step_name, json.dumps(summary, ensure_ascii=False))
+    mark_done(fs, layout.root, step_name, dumps(summary))
@@ -2,20 +2,130 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Dict
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from _core_pybinds.sensor_data import TimeDomain
 
 from ..config import ExtractorConfig
 from ..constants import SENSOR_FILES
 from ..io import Filesystem
+from ..jsonutils import dumps
 from ..logger import LogTimer
 from ..paths import OutputLayout
 from ..provider import AriaVrsProvider
 from ..quality import QualityFlagger
 from ..status import clear_done, is_done, mark_done
+from ._common import bind_time_reader
+
+# Samples are gathered per stream and serialized a batch at a time.
+IMU_BATCH_SIZE = 1024
+
+# (payload key, motion vector attribute, motion validity attribute)
+_IMU_VECTORS = (
+    ("acc", "accel_msec2", "accel_valid"),
+    ("gyro", "gyro_radsec", "gyro_valid"),
+    ("mag", "mag_tesla", "mag_valid"),
+)
+
+
+def _tuple_getter(attrs: List[str]) -> Callable[[Any], Tuple[Any, ...]]:
+    # attrgetter returns a bare value, not a 1-tuple, for a single attribute
+    if not attrs:
+        return lambda motion: ()
+    getter = attrgetter(*attrs)
+    if len(attrs) == 1:
+        return lambda motion: (getter(motion),)
+    return getter
+
+
+class _ImuBatch:
+    """Column-oriented buffer of IMU samples for one stream.
+
+    Each sample writes an int64 timestamp and three float64 xyz vectors into
+    preallocated arrays; payload dicts only exist while a full batch is
+    serialized. Call :meth:`bind` with a stream's first motion record before
+    appending its samples.
+    """
+
+    __slots__ = ("size", "ts", "vectors", "valid", "_axes", "_read_valid", "_read_vectors")
+
+    def __init__(self, capacity: int = IMU_BATCH_SIZE) -> None:
+        self.size = 0
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.vectors = np.empty((len(_IMU_VECTORS), capacity, 3), dtype=np.float64)
+        self.valid = np.zeros((len(_IMU_VECTORS), capacity), dtype=bool)
+        self._axes: Tuple[int, ...] = ()
+        self._read_valid: Callable[[Any], Tuple[Any, ...]] = lambda motion: ()
+        self._read_vectors: Callable[[Any], Tuple[Any, ...]] = lambda motion: ()
+
+    def bind(self, sample: Any) -> None:
+        """Build the attribute readers for motion records shaped like ``sample``.
+
+        Axes whose validity flag or vector is missing on ``sample`` always
+        read as invalid, so each later record costs one ``attrgetter`` call
+        for the flags and one for the vectors.
+        """
+        present = [
+            (axis, vector_attr, valid_attr)
+            for axis, (_, vector_attr, valid_attr) in enumerate(_IMU_VECTORS)
+            if hasattr(sample, valid_attr) and hasattr(sample, vector_attr)
+        ]
+        self._axes = tuple(axis for axis, _, _ in present)
+        # append only writes bound axes; the rest must not keep an earlier stream's flags
+        self.valid.fill(False)
+        self._read_valid = _tuple_getter([valid_attr for _, _, valid_attr in present])
+        self._read_vectors = _tuple_getter([vector_attr for _, vector_attr, _ in present])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def full(self) -> bool:
+        return self.size == len(self.ts)
+
+    def append(self, ts_ns: int, motion: object) -> None:
+        i = self.size
+        self.ts[i] = ts_ns
+        valid = self.valid
+        vectors = self.vectors
+        for axis, ok, vector in zip(self._axes, self._read_valid(motion), self._read_vectors(motion)):
+            if ok:
+                valid[axis, i] = True
+                vectors[axis, i] = vector
+            else:
+                valid[axis, i] = False
+        self.size = i + 1
+
+    def ts_range(self) -> Tuple[int, int]:
+        ts = self.ts[: self.size]
+        return int(ts.min()), int(ts.max())
+
+    def serialize(self, stream_id: str, evaluate_flags: Callable[[dict], List[str]]) -> bytes:
+        """Return the batch as JSONL bytes and reset it."""
+        n = self.size
+        # tolist() converts each column to Python scalars in one C call
+        columns = []
+        for axis in range(len(_IMU_VECTORS)):
+            rows = self.vectors[axis, :n].tolist()
+            valid = self.valid[axis, :n].tolist()
+            columns.append([row if ok else None for row, ok in zip(rows, valid)])
+        lines = []
+        for ts_ns, acc, gyro, mag in zip(self.ts[:n].tolist(), *columns):
+            payload = {
+                "ts_ns": ts_ns,
+                "sensor": "imu",
+                "stream_id": stream_id,
+                "acc": acc,
+                "gyro": gyro,
+                "mag": mag,
+            }
+            payload["quality_flags"] = evaluate_flags(payload)
+            lines.append(dumps(payload, newline=True))
+        self.size = 0
+        return b"".join(lines)
 
 
 def extract_imu(
@@ -27,6 +137,7 @@ def extract_imu(
     vrs_path: str,
     force: bool,
     logger: logging.Logger,
+    provider: Optional[AriaVrsProvider] = None,
 ) -> None:
     if not config.imu.export:
         logger.info(
@@ -46,7 +157,7 @@ def extract_imu(
     if force:
         clear_done(fs, layout.root, step_name)
 
-    provider = AriaVrsProvider(vrs_path)
+    provider = provider or AriaVrsProvider(vrs_path)
     imu_streams = provider.resolve_imu_streams()
 
     jsonl_path = layout.sensor_file(SENSOR_FILES["imu"])
@@ -61,6 +172,8 @@ def extract_imu(
         "streams": [info.numeric_name for info in imu_streams],
     }
 
+    evaluate_flags = quality_flagger.compile("imu")
+
     with LogTimer(
         logger,
         "IMU extraction completed",
@@ -69,29 +182,33 @@ def extract_imu(
         recording_id=config.recording_id,
         extra={"streams": summary["streams"], "jsonl": jsonl_path},
     ):
-        with fs.open(jsonl_path, "wt") as jsonl_file:
+        with fs.open_jsonl(jsonl_path) as jsonl_file:
+
+            batch = _ImuBatch()
+
+            def write_batch(stream_id: str) -> None:
+                count = len(batch)
+                # one numpy reduction per batch instead of min/max per sample
+                ts_min, ts_max = batch.ts_range()
+                summary["ts_first"] = ts_min if summary["ts_first"] is None else min(summary["ts_first"], ts_min)  # type: ignore[arg-type]
+                summary["ts_last"] = ts_max if summary["ts_last"] is None else max(summary["ts_last"], ts_max)  # type: ignore[arg-type]
+                chunk = batch.serialize(stream_id, evaluate_flags)
+                jsonl_file.write(chunk)
+                summary["count"] = int(summary["count"]) + count  # type: ignore[arg-type]
+                summary["bytes"] = int(summary["bytes"]) + len(chunk)  # type: ignore[arg-type]
+
             for info in imu_streams:
+                read_ts = None
                 iterator = provider.deliver_stream([info.stream_id])
                 for data in iterator:
                     motion = data.imu_data()
-                    ts_ns = int(data.get_time_ns(TimeDomain.DEVICE_TIME))
-                    summary["ts_first"] = ts_ns if summary["ts_first"] is None else min(summary["ts_first"], ts_ns)  # type: ignore[arg-type]
-                    summary["ts_last"] = ts_ns if summary["ts_last"] is None else max(summary["ts_last"], ts_ns)  # type: ignore[arg-type]
-
-                    payload = {
-                        "ts_ns": ts_ns,
-                        "sensor": "imu",
-                        "stream_id": info.numeric_name,
-                        "acc": list(motion.accel_msec2) if getattr(motion, "accel_valid", False) else None,
-                        "gyro": list(motion.gyro_radsec) if getattr(motion, "gyro_valid", False) else None,
-                        "mag": list(motion.mag_tesla) if getattr(motion, "mag_valid", False) else None,
-                    }
-                    flags = quality_flagger.evaluate(payload)
-                    payload["quality_flags"] = flags
-
-                    record = json.dumps(payload, ensure_ascii=False)
-                    jsonl_file.write(record + "\n")
-                    summary["count"] = int(summary["count"]) + 1  # type: ignore[arg-type]
-                    summary["bytes"] = int(summary["bytes"]) + len(record) + 1  # include newline
-
-    mark_done(fs, layout.root, step_name, json.dumps(summary, ensure_ascii=False))
+                    if read_ts is None:
+                        read_ts = bind_time_reader(data, TimeDomain.DEVICE_TIME)
+                        batch.bind(motion)
+                    batch.append(read_ts(data), motion)
+                    if batch.full():
+                        write_batch(info.numeric_name)
+                if len(batch):
+                    write_batch(info.numeric_name)
+
+    mark_done(fs, layout.root, step_name, dumps(summary))
@@ -3,67 +3,102 @@
 from __future__ import annotations
 
 import datetime as dt
-import json
+import hashlib
 import logging
-from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Optional
 from urllib.parse import urlparse
 
-from ..constants import DONE_DIRNAME
-from ..io import FileInfo, Filesystem, ensure_directory, join_uri
+from ..io import Filesystem, ensure_directory, join_uri, new_blake3
+from ..jsonutils import dumps
 from ..logger import LogTimer
-from ..status import clear_done, is_done, mark_done
+from ..status import done_steps, mark_done, read_summaries
 from ..timeutils import derive_partition_dt
 
 
-def _read_summary(fs: Filesystem, marker_path: str) -> Optional[Dict]:
-    if not fs.exists(marker_path):
-        return None
-    with fs.open(marker_path, "rt") as handle:
-        content = handle.read().strip()
-        if not content:
-            return None
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            return None
-
-
-def _logical_path(root: str, uri: str) -> str:
-    if not uri:
-        return ""
+def _logical_path_resolver(root: str) -> Callable[[str], str]:
+    """Return ``uri -> path relative to root``; ``root`` is parsed once, not per entry."""
     root_str = root.rstrip("/")
-    if uri.startswith(root_str):
-        relative = uri[len(root_str):].lstrip("/")
-        return relative
     parsed_root = urlparse(root)
-    parsed_uri = urlparse(uri)
-    if parsed_root.scheme and parsed_root.scheme == parsed_uri.scheme:
-        rel = parsed_uri.path[len(parsed_root.path):].lstrip("/")
-        return rel
-    return uri
 
+    def logical_path(uri: str) -> str:
+        if not uri:
+            return ""
+        if uri.startswith(root_str):
+            return uri[len(root_str):].lstrip("/")
+        if parsed_root.scheme:
+            parsed_uri = urlparse(uri)
+            if parsed_root.scheme == parsed_uri.scheme:
+                return parsed_uri.path[len(parsed_root.path):].lstrip("/")
+        return uri
+
+    return logical_path
+
+
+@lru_cache(maxsize=64)
+def _recording_id_from_root(root: str) -> str:
+    """Use the last path segment of ``root`` as the recording id."""
+    if "://" not in root:
+        return root.rstrip("/").rpartition("/")[2] or "unknown_recording"
+    parts = [p for p in urlparse(root).path.split("/") if p]
+    return parts[-1] if parts else "unknown_recording"
 
-def _collect_directory_checksums(fs: Filesystem, uri: str) -> Dict[str, object]:
-    import hashlib
 
-    sha256 = hashlib.sha256()
-    md5 = hashlib.md5()
+def _collect_directory_checksums(fs: Filesystem, uri: str, *, with_blake3: bool = False) -> Optional[Dict[str, object]]:
+    """Roll up checksums for the files under ``uri``; ``None`` if it does not exist.
+
+    Directory entries only carry SHA-256 (and BLAKE3 when requested); per-file
+    MD5 is reserved for JSONL entries.
+    """
+    file_paths = sorted(fs.list_files(uri))
+    # listing a missing directory yields nothing, so only an empty listing needs
+    # the extra existence check
+    if not file_paths and not fs.exists(uri):
+        return None
+    sha256 = hashlib.new("sha256", usedforsecurity=False)
+    blake3 = new_blake3() if with_blake3 else None
     total_bytes = 0
     count = 0
-    for file_path in sorted(fs.list_files(uri)):
-        info = fs.compute_checksums(file_path)
+    # hashed on fs's worker threads; folding in sorted order keeps the rollup deterministic
+    infos = fs.compute_checksums_many(file_paths, with_blake3=with_blake3)
+    for file_path, info in zip(file_paths, infos):
         sha256.update(f"{file_path}:{info.checksum_sha256}".encode("utf-8"))
-        md5.update(f"{file_path}:{info.checksum_md5}".encode("utf-8"))
+        if blake3 is not None:
+            blake3.update(f"{file_path}:{info.checksum_blake3}".encode("utf-8"))
         total_bytes += info.size
         count += 1
+    checksum = {"sha256": sha256.hexdigest()}
+    if blake3 is not None:
+        checksum["blake3"] = blake3.hexdigest()
     return {
         "count": count,
         "bytes": total_bytes,
-        "checksum": {"sha256": sha256.hexdigest(), "md5": md5.hexdigest()},
+        "checksum": checksum,
     }
 
 
+# a handful of page-sized writes instead of one manifest-sized string
+MANIFEST_BUFFER_SIZE = 64 * 1024
+
+
+def _encode_manifest(manifest: Dict[str, object]) -> Iterator[bytes]:
+    """Yield ``dumps(manifest, indent=True, newline=True)`` in pieces.
+
+    The top-level values are encoded one at a time, and ``files`` one entry at
+    a time, so the full document never exists as a single bytes object.
+    """
+    for index, (key, value) in enumerate(manifest.items()):
+        yield (b",\n  " if index else b"{\n  ") + dumps(key) + b": "
+        if key == "files" and value:
+            for position, entry in enumerate(value):  # type: ignore[arg-type]
+                yield (b",\n    " if position else b"[\n    ") + dumps(entry, indent=True).replace(b"\n", b"\n    ")
+            yield b"\n  ]"
+        else:
+            yield dumps(value, indent=True).replace(b"\n", b"\n  ")
+    yield b"\n}\n" if manifest else b"{}\n"
+
+
 def write_manifest(
     *,
     fs: Filesystem,
@@ -76,15 +111,16 @@ def write_manifest(
     recording_id: Optional[str],
     partition_dt: Optional[str],
     logger: logging.Logger,
+    with_blake3: bool = False,
 ) -> None:
     step_name = "write_manifest"
-    if is_done(fs, root, step_name):
+    # one listing answers every marker lookup below
+    present = done_steps(fs, root)
+    if step_name in present:
         logger.info("Manifest already generated", extra={"root": root})
         return
 
-    done_dir = join_uri(root, DONE_DIRNAME)
-    summaries: List[Dict] = []
-    for step in [
+    steps = [
         "extract_rgb",
         "extract_et",
         "extract_audio",
@@ -93,65 +129,53 @@ def write_manifest(
         "extract_wifi",
         "extract_bt",
         "merge_events",
-    ]:
-        marker_path = join_uri(done_dir, f"{step}.done")
-        summary = _read_summary(fs, marker_path)
-        if summary:
-            summary["_step"] = step
-            summaries.append(summary)
+    ]
+    summaries: List[Dict] = []
+    for step, summary in read_summaries(fs, root, (step for step in steps if step in present)).items():
+        summary["_step"] = step
+        summaries.append(summary)
 
     if not summaries:
         logger.warning("No extraction summaries found; manifest not written", extra={"root": root})
         return
 
-    jsonl_summaries = [s for s in summaries if "jsonl" in s]
-    if jsonl_summaries:
-        first_jsonl = jsonl_summaries[0]["jsonl"]
-        sensors_dir = first_jsonl.rsplit("/", 1)[0]
-    else:
-        sensors_dir = join_uri(root, "sensors")
-
     manifest_dir = join_uri(root, "manifest")
     manifest_path = join_uri(manifest_dir, "manifest.json")
     ensure_directory(fs, manifest_dir)
 
-    now = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc).isoformat()
+    now = dt.datetime.now(dt.timezone.utc).isoformat()
 
     if not recording_id:
-        parsed = urlparse(root)
-        if parsed.scheme:
-            parts = [p for p in parsed.path.split("/") if p]
-        else:
-            parts = Path(root).parts
-        recording_id = parts[-1] if parts else "unknown_recording"
+        recording_id = _recording_id_from_root(root)
     if not device_id:
         device_id = "unknown_device"
 
-    ts_candidates = [s.get("ts_first") for s in summaries if s.get("ts_first") is not None]
-    auto_dt = derive_partition_dt(int(min(ts_candidates)) if ts_candidates else None)
+    ts_start = min((ts for ts in (s.get("ts_first") for s in summaries) if ts is not None), default=None)
+    auto_dt = derive_partition_dt(None if ts_start is None else int(ts_start))
     partition_keys = {
         "dt": partition_dt or auto_dt or "unknown",
         "device_id": device_id,
         "recording_id": recording_id,
     }
 
-    file_entries: List[Dict[str, object]] = []
+    logical_path = _logical_path_resolver(root)
 
-    def add_jsonl_entry(summary: Dict) -> None:
-        jsonl_uri = summary.get("jsonl")
-        if not jsonl_uri or not fs.exists(jsonl_uri):
-            return
-        info = fs.compute_checksums(jsonl_uri)
-        entry = {
-            "logical_path": _logical_path(root, jsonl_uri),
-            "physical_uri": jsonl_uri,
-            "stream_type": summary.get("sensor", "events"),
-            "bytes": info.size,
-            "count": summary.get("count", 0),
-            "checksum": {
-                "sha256": info.checksum_sha256,
-                "md5": info.checksum_md5,
-            },
+    def file_entry(
+        summary: Dict,
+        uri: str,
+        logical: str,
+        stream_type: object,
+        size: int,
+        count: int,
+        checksum: Dict,
+    ) -> Dict[str, object]:
+        return {
+            "logical_path": logical,
+            "physical_uri": uri,
+            "stream_type": stream_type,
+            "bytes": size,
+            "count": count,
+            "checksum": checksum,
             "ts_range_ns": {
                 "start": summary.get("ts_first"),
                 "end": summary.get("ts_last"),
@@ -160,37 +184,54 @@ def write_manifest(
             "source": "extracted_from_vrs",
             "notes": "",
         }
-        file_entries.append(entry)
-
-    def add_artifact_entry(summary: Dict) -> None:
-        artifacts = summary.get("artifacts") or []
-        for artifact in artifacts:
-            uri = artifact.get("uri")
-            if not uri:
-                continue
-            if not fs.exists(uri):
-                continue
-            metrics = _collect_directory_checksums(fs, uri)
-            entry = {
-                "logical_path": _logical_path(root, uri) + "/",
-                "physical_uri": uri,
-                "stream_type": summary.get("sensor"),
-                "bytes": metrics["bytes"],
-                "count": metrics["count"],
-                "checksum": metrics["checksum"],
-                "ts_range_ns": {
-                    "start": summary.get("ts_first"),
-                    "end": summary.get("ts_last"),
-                },
-                "tool_version": tool_version,
-                "source": "extracted_from_vrs",
-                "notes": "",
-            }
-            file_entries.append(entry)
-
-    for summary in summaries:
-        add_jsonl_entry(summary)
-        add_artifact_entry(summary)
+
+    def jsonl_entry(summary: Dict) -> Optional[Dict[str, object]]:
+        jsonl_uri = summary.get("jsonl")
+        if not jsonl_uri:
+            return None
+        try:
+            info = fs.compute_checksums(jsonl_uri, with_md5=True, with_blake3=with_blake3)
+        except FileNotFoundError:
+            return None
+        checksum = {
+            "sha256": info.checksum_sha256,
+            "md5": info.checksum_md5,
+        }
+        if info.checksum_blake3 is not None:
+            checksum["blake3"] = info.checksum_blake3
+        return file_entry(
+            summary,
+            jsonl_uri,
+            logical_path(jsonl_uri),
+            summary.get("sensor", "events"),
+            info.size,
+            summary.get("count", 0),
+            checksum,
+        )
+
+    def artifact_entry(summary: Dict, artifact: Dict) -> Optional[Dict[str, object]]:
+        uri = artifact.get("uri")
+        if not uri:
+            return None
+        metrics = _collect_directory_checksums(fs, uri, with_blake3=with_blake3)
+        if metrics is None:
+            return None
+        return file_entry(
+            summary,
+            uri,
+            logical_path(uri) + "/",
+            summary.get("sensor"),
+            metrics["bytes"],
+            metrics["count"],
+            metrics["checksum"],
+        )
+
+    # each summary contributes its JSONL entry followed by its artifact directories
+    candidates = chain.from_iterable(
+        chain((jsonl_entry(summary),), (artifact_entry(summary, a) for a in summary.get("artifacts") or ()))
+        for summary in summaries
+    )
+    file_entries = [entry for entry in candidates if entry is not None]
 
     manifest = {
         "schema_version": "1.0.0",
@@ -218,13 +259,13 @@ def write_manifest(
         recording_id=recording_id,
         extra={"manifest": manifest_path},
     ):
-        with fs.open(manifest_path, "wt") as handle:
-            json.dump(manifest, handle, indent=2, ensure_ascii=False)
-            handle.write("\n")
+        # readers polling for the manifest must never pick up a half-written one
+        with fs.open_atomic(manifest_path, buffering=MANIFEST_BUFFER_SIZE) as handle:
+            handle.writelines(_encode_manifest(manifest))
 
     mark_done(
         fs,
         root,
         step_name,
-        json.dumps({"manifest": manifest_path, "files": len(file_entries)}, ensure_ascii=False),
+        dumps({"manifest": manifest_path, "files": len(file_entries)}),
     )
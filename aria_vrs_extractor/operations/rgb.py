@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-import io
-import json
 import logging
+import os
+from functools import partial
 from typing import Dict, Optional
 
 import numpy as np
-from PIL import Image
 
+from ..concurrency import OrderedTaskPool
 from ..config import ExtractorConfig
 from ..constants import SENSOR_FILES
-from ..io import Filesystem, ensure_directory, join_uri
+from ..imaging import encode_jpeg, resize
+from ..io import Filesystem, ensure_directory
+from ..jsonutils import dumps
 from ..logger import LogTimer
 from ..paths import OutputLayout
 from ..provider import AriaVrsProvider
@@ -27,15 +29,9 @@ def _save_jpeg(
     *,
     quality: int = 95,
 ) -> int:
-    image = Image.fromarray(image_array)
-    buffer = io.BytesIO()
-    image.save(buffer, format="JPEG", quality=quality)
-    payload = buffer.getvalue()
-    parent = path.rsplit("/", 1)[0] if "/" in path else ""
-    if parent:
-        ensure_directory(fs, parent)
-    with fs.open(path, "wb") as handle:
-        handle.write(payload)
+    payload = encode_jpeg(image_array, quality=quality)
+    # extract_rgb creates layout.rgb_dir before the first frame
+    fs.write_bytes(path, payload)
     return len(payload)
 
 
@@ -48,6 +44,7 @@ def extract_rgb(
     vrs_path: str,
     force: bool,
     logger: logging.Logger,
+    provider: Optional[AriaVrsProvider] = None,
 ) -> None:
     if not config.rgb.export:
         logger.info(
@@ -70,7 +67,7 @@ def extract_rgb(
     ensure_directory(fs, layout.rgb_dir)
     ensure_directory(fs, layout.sensors_dir)
 
-    provider = AriaVrsProvider(vrs_path)
+    provider = provider or AriaVrsProvider(vrs_path)
     rgb_stream = provider.resolve_rgb_stream()
 
     jsonl_path = layout.sensor_file(SENSOR_FILES["rgb"])
@@ -100,6 +97,8 @@ def extract_rgb(
 
     artifact = summary["artifacts"][0]  # type: ignore[index]
 
+    evaluate_flags = quality_flagger.compile("rgb")
+
     with LogTimer(
         logger,
         "RGB extraction completed",
@@ -108,50 +107,65 @@ def extract_rgb(
         recording_id=config.recording_id,
         extra=timer_extra,
     ):
-        with fs.open(jsonl_path, "wt") as jsonl_file:
-            iterator = provider.deliver_stream([rgb_stream.stream_id])
-            for data in iterator:
-                image, record = data.image_data_and_record()
-                if not image.is_valid():
-                    continue
-
-                frame_array = image.to_numpy_array()
-                if config.rgb.downscale:
-                    width, height = config.rgb.downscale
-                    pil_image = Image.fromarray(frame_array)
-                    frame_array = np.array(pil_image.resize((width, height), resample=Image.BILINEAR))
-                height_px, width_px = frame_array.shape[:2]
-
-                frame_id: int
-                record_frame = getattr(record, "frame_number", None)
-                if record_frame is None:
-                    frame_id = int(summary["count"])  # type: ignore[arg-type]
-                else:
-                    frame_id = int(record_frame)
-                filename = f"frame_{frame_id:06d}.jpg"
-                frame_uri = join_uri(layout.rgb_dir, filename)
-
-                bytes_written = _save_jpeg(fs, frame_array, frame_uri)
-                summary["bytes"] = int(summary["bytes"]) + bytes_written  # type: ignore[arg-type]
-                summary["count"] = int(summary["count"]) + 1  # type: ignore[arg-type]
-                artifact["bytes"] = int(artifact["bytes"]) + bytes_written
-                artifact["count"] = int(artifact["count"]) + 1
-
-                ts_ns = int(getattr(record, "capture_timestamp_ns"))
-                summary["ts_first"] = ts_ns if summary["ts_first"] is None else min(summary["ts_first"], ts_ns)  # type: ignore[arg-type]
-                summary["ts_last"] = ts_ns if summary["ts_last"] is None else max(summary["ts_last"], ts_ns)  # type: ignore[arg-type]
-
-                payload = {
-                    "ts_ns": ts_ns,
-                    "sensor": "rgb",
-                    "frame_id": frame_id,
-                    "uri": frame_uri,
-                    "width": int(width_px),
-                    "height": int(height_px),
-                    "stream_id": rgb_stream.numeric_name,
-                }
-                flags = quality_flagger.evaluate(payload)
-                payload["quality_flags"] = flags
-                jsonl_file.write(json.dumps(payload, ensure_ascii=False) + "\n")
-
-    mark_done(fs, layout.root, step_name, json.dumps(summary, ensure_ascii=False))
+        downscale = config.rgb.downscale
+        ts_first: Optional[int] = None
+        ts_last: Optional[int] = None
+        # the summary and its single artifact always move together, so one pair
+        # of counters serves both; they are written back after the pool drains
+        count = total_bytes = 0
+        with fs.open_jsonl(jsonl_path) as jsonl_file:
+
+            def finish_frame(line: bytes, bytes_written: int) -> None:
+                # runs on this thread, in frame order, once the JPEG is written
+                nonlocal count, total_bytes
+                count += 1
+                total_bytes += bytes_written
+                jsonl_file.write(line)
+
+            frames_submitted = 0
+            with OrderedTaskPool(os.cpu_count() or 1) as encoders:
+                iterator = provider.deliver_stream([rgb_stream.stream_id])
+                for data in iterator:
+                    image, record = data.image_data_and_record()
+                    if not image.is_valid():
+                        continue
+
+                    frame_array = image.to_numpy_array()
+                    if downscale:
+                        frame_array = resize(frame_array, downscale.w, downscale.h)
+                    height_px, width_px = frame_array.shape[:2]
+
+                    record_frame = getattr(record, "frame_number", None)
+                    frame_id = int(record_frame) if record_frame is not None else frames_submitted
+                    filename = f"frame_{frame_id:06d}.jpg"
+                    frame_uri = layout.join(layout.rgb_dir, filename)
+                    frames_submitted += 1
+
+                    ts_ns = int(getattr(record, "capture_timestamp_ns"))
+                    if ts_first is None or ts_ns < ts_first:
+                        ts_first = ts_ns
+                    if ts_last is None or ts_ns > ts_last:
+                        ts_last = ts_ns
+
+                    payload = {
+                        "ts_ns": ts_ns,
+                        "sensor": "rgb",
+                        "frame_id": frame_id,
+                        "uri": frame_uri,
+                        "width": int(width_px),
+                        "height": int(height_px),
+                        "stream_id": rgb_stream.numeric_name,
+                    }
+                    payload["quality_flags"] = evaluate_flags(payload, frame_array)
+
+                    encoders.submit(
+                        _save_jpeg,
+                        fs,
+                        frame_array,
+                        frame_uri,
+                        on_result=partial(finish_frame, dumps(payload, newline=True)),
+                    )
+        summary.update(count=count, bytes=total_bytes, ts_first=ts_first, ts_last=ts_last)
+        artifact.update(count=count, bytes=total_bytes)
+
+    mark_done(fs, layout.root, step_name, dumps(summary))
@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
 from _core_pybinds.sensor_data import TimeDomain
 
 from ..config import ExtractorConfig
 from ..constants import SENSOR_FILES
 from ..io import Filesystem
+from ..jsonutils import dumps
 from ..logger import LogTimer
 from ..paths import OutputLayout
 from ..provider import AriaVrsProvider
 from ..quality import QualityFlagger
 from ..status import clear_done, is_done, mark_done
+from ._common import bind_fields, bind_time_reader
+
+# (payload key, record attribute)
+_WIFI_FIELDS = (
+    ("ap_mac", "bssid_mac"),
+    ("ssid", "ssid"),
+    ("rssi", "rssi"),
+    ("freq_mhz", "freq_mhz"),
+)
 
 
 def extract_wifi(
@@ -27,6 +36,7 @@ def extract_wifi(
     vrs_path: str,
     force: bool,
     logger: logging.Logger,
+    provider: Optional[AriaVrsProvider] = None,
 ) -> None:
     if not config.wifi.export:
         logger.info(
@@ -46,7 +56,7 @@ def extract_wifi(
     if force:
         clear_done(fs, layout.root, step_name)
 
-    provider = AriaVrsProvider(vrs_path)
+    provider = provider or AriaVrsProvider(vrs_path)
     wifi_streams = provider.resolve_wifi_streams()
     if not wifi_streams:
         logger.warning(
@@ -67,6 +77,8 @@ def extract_wifi(
         "streams": [info.numeric_name for info in wifi_streams],
     }
 
+    evaluate_flags = quality_flagger.compile("wifi")
+
     with LogTimer(
         logger,
         "Wi-Fi extraction completed",
@@ -75,29 +87,37 @@ def extract_wifi(
         recording_id=config.recording_id,
         extra={"streams": summary["streams"], "jsonl": jsonl_path},
     ):
-        with fs.open(jsonl_path, "wt") as jsonl_file:
+        # accumulated in locals and written into summary once, after the last record
+        count = nbytes = 0
+        ts_first: Optional[int] = None
+        ts_last: Optional[int] = None
+        with fs.open_jsonl(jsonl_path) as jsonl_file:
             for info in wifi_streams:
+                read_fields = read_ts = None
                 iterator = provider.deliver_stream([info.stream_id])
                 for data in iterator:
                     wifi = data.wps_data()
-                    ts_ns = int(data.get_time_ns(TimeDomain.DEVICE_TIME))
-                    summary["ts_first"] = ts_ns if summary["ts_first"] is None else min(summary["ts_first"], ts_ns)  # type: ignore[arg-type]
-                    summary["ts_last"] = ts_ns if summary["ts_last"] is None else max(summary["ts_last"], ts_ns)  # type: ignore[arg-type]
+                    if read_fields is None:
+                        read_fields = bind_fields(wifi, _WIFI_FIELDS)
+                        read_ts = bind_time_reader(data, TimeDomain.DEVICE_TIME)
+                    ts_ns = read_ts(data)
+                    if ts_first is None or ts_ns < ts_first:
+                        ts_first = ts_ns
+                    if ts_last is None or ts_ns > ts_last:
+                        ts_last = ts_ns
 
                     payload = {
                         "ts_ns": ts_ns,
                         "sensor": "wifi",
                         "stream_id": info.numeric_name,
-                        "ap_mac": getattr(wifi, "bssid_mac", None),
-                        "ssid": getattr(wifi, "ssid", None),
-                        "rssi": getattr(wifi, "rssi", None),
-                        "freq_mhz": getattr(wifi, "freq_mhz", None),
+                        **read_fields(wifi),
                     }
-                    payload["quality_flags"] = quality_flagger.evaluate(payload)
+                    payload["quality_flags"] = evaluate_flags(payload)
 
-                    record = json.dumps(payload, ensure_ascii=False)
-                    jsonl_file.write(record + "\n")
-                    summary["count"] = int(summary["count"]) + 1  # type: ignore[arg-type]
-                    summary["bytes"] = int(summary["bytes"]) + len(record) + 1
+                    record = dumps(payload, newline=True)
+                    jsonl_file.write(record)
+                    count += 1
+                    nbytes += len(record)
+        summary.update(count=count, bytes=nbytes, ts_first=ts_first, ts_last=ts_last)
 
-    mark_done(fs, layout.root, step_name, json.dumps(summary, ensure_ascii=False))
+    mark_done(fs, layout.root, step_name, dumps(summary))
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable
 
 from .config import ExtractorConfig
-from .io import join_uri, is_remote
+from .io import is_remote, join_local, join_remote
 
 
 @dataclass(slots=True)
@@ -19,26 +19,29 @@ class OutputLayout:
     et_right_dir: str
     audio_dir: str
     manifest_dir: str
+    # chosen once from the root scheme so per-file joins skip is_remote
+    join: Callable[..., str] = field(default=join_local, repr=False, compare=False)
 
     @classmethod
     def from_config(cls, config: ExtractorConfig) -> "OutputLayout":
         root = config.output_root.rstrip("/")
-        sensors_dir = join_uri(root, config.paths.sensors_dir)
+        join = join_remote if is_remote(root) else join_local
         return cls(
             root=root,
-            sensors_dir=sensors_dir,
-            rgb_dir=join_uri(root, config.paths.rgb_frames),
-            et_left_dir=join_uri(root, config.paths.et_left),
-            et_right_dir=join_uri(root, config.paths.et_right),
-            audio_dir=join_uri(root, config.paths.audio_chunks),
-            manifest_dir=join_uri(root, config.paths.manifest_dir),
+            sensors_dir=join(root, config.paths.sensors_dir),
+            rgb_dir=join(root, config.paths.rgb_frames),
+            et_left_dir=join(root, config.paths.et_left),
+            et_right_dir=join(root, config.paths.et_right),
+            audio_dir=join(root, config.paths.audio_chunks),
+            manifest_dir=join(root, config.paths.manifest_dir),
+            join=join,
         )
 
     def sensor_file(self, filename: str) -> str:
-        return join_uri(self.sensors_dir, filename)
+        return self.join(self.sensors_dir, filename)
 
     def manifest_file(self, filename: str) -> str:
-        return join_uri(self.manifest_dir, filename)
+        return self.join(self.manifest_dir, filename)
 
     def local_root_path(self) -> Path:
         if is_remote(self.root):
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from _core_pybinds.data_provider import create_vrs_data_provider
 from _core_pybinds.sensor_data import SensorDataType, TimeDomain
@@ -30,6 +30,13 @@ class AriaVrsProvider:
         if not self.provider:
             raise ValueError(f"Unable to open VRS file at {vrs_path}")
         self._streams: List[StreamInfo] = self._scan_streams()
+        # the stream set is fixed once the file is open, so index it up front
+        self._by_type: Dict[SensorDataType, List[StreamInfo]] = {}
+        for info in self._streams:
+            self._by_type.setdefault(info.sensor_type, []).append(info)
+        self._labels_lower: List[Tuple[str, StreamInfo]] = [
+            (info.label.lower(), info) for info in self._streams if info.label
+        ]
 
     def _scan_streams(self) -> List[StreamInfo]:
         streams: List[StreamInfo] = []
@@ -54,17 +61,13 @@ class AriaVrsProvider:
         return list(self._streams)
 
     def find_streams_by_type(self, sensor_type: SensorDataType) -> List[StreamInfo]:
-        return [info for info in self._streams if info.sensor_type == sensor_type]
+        return list(self._by_type.get(sensor_type, ()))
 
     def find_stream_by_label(self, *candidates: str) -> Optional[StreamInfo]:
         normalized = [candidate.lower() for candidate in candidates]
-        for info in self._streams:
-            if not info.label:
-                continue
-            label_lower = info.label.lower()
-            for candidate in normalized:
-                if candidate in label_lower:
-                    return info
+        for label_lower, info in self._labels_lower:
+            if any(candidate in label_lower for candidate in normalized):
+                return info
         return None
 
     def resolve_rgb_stream(self) -> StreamInfo:
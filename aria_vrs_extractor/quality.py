@@ -3,22 +3,97 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Iterable, List, Protocol
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Protocol
+
+if TYPE_CHECKING:  # numpy is imported lazily so merge-events/write-manifest never load it
+    import numpy as np
 
 
 class QualityEvaluator(Protocol):
     def __call__(self, payload: dict) -> bool: ...
 
 
+class FrameEvaluator(Protocol):
+    def __call__(self, frame: np.ndarray) -> bool: ...
+
+
 @dataclass(slots=True)
 class QualityFlagger:
     enabled_flags: Iterable[str]
     evaluators: Dict[str, QualityEvaluator] = field(default_factory=dict)
+    # flags computed from the decoded image / sample array instead of the payload
+    frame_evaluators: Dict[str, FrameEvaluator] = field(default_factory=dict)
+    # flag name -> sensors the evaluator applies to; None means every sensor
+    sensor_scopes: Dict[str, Optional[FrozenSet[str]]] = field(default_factory=dict)
 
-    def register(self, name: str, evaluator: QualityEvaluator) -> None:
+    def register(
+        self,
+        name: str,
+        evaluator: QualityEvaluator,
+        *,
+        sensors: Optional[Iterable[str]] = None,
+    ) -> None:
         if name not in self.enabled_flags:
             raise ValueError(f"Quality flag '{name}' is not enabled in the configuration")
+        self.frame_evaluators.pop(name, None)
         self.evaluators[name] = evaluator
+        self.sensor_scopes[name] = frozenset(sensors) if sensors is not None else None
+
+    def register_frame(
+        self,
+        name: str,
+        evaluator: FrameEvaluator,
+        *,
+        sensors: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Register ``evaluator`` to run on the raw numpy frame rather than the payload dict.
+
+        Extractors that have an array at hand (RGB and ET images, audio
+        samples) pass it to the compiled evaluator, so vectorized kernels such
+        as :func:`laplacian_variance` avoid any per-pixel Python work.
+        """
+        if name not in self.enabled_flags:
+            raise ValueError(f"Quality flag '{name}' is not enabled in the configuration")
+        self.evaluators.pop(name, None)
+        self.frame_evaluators[name] = evaluator
+        self.sensor_scopes[name] = frozenset(sensors) if sensors is not None else None
+
+    def compile(self, sensor: str) -> Callable[..., List[str]]:
+        """Return ``evaluate(payload, frame=None)`` bound to the evaluators relevant to ``sensor``.
+
+        Extractors call this once before their record loop. Evaluators
+        registered afterwards are not picked up. Frame evaluators only run when
+        a ``frame`` is passed.
+        """
+        bound = []
+        for name in self.enabled_flags:
+            scope = self.sensor_scopes.get(name)
+            if scope is not None and sensor not in scope:
+                continue
+            evaluator = self.evaluators.get(name)
+            if evaluator is not None:
+                bound.append((name, evaluator, False))
+                continue
+            frame_evaluator = self.frame_evaluators.get(name)
+            if frame_evaluator is not None:
+                bound.append((name, frame_evaluator, True))
+        if not bound:
+            return lambda payload, frame=None: []
+        if not any(on_frame for _, _, on_frame in bound):
+            payload_only = [(name, evaluator) for name, evaluator, _ in bound]
+            return lambda payload, frame=None: [name for name, evaluator in payload_only if evaluator(payload)]
+
+        def evaluate(payload: dict, frame: Optional[np.ndarray] = None) -> List[str]:
+            flags: List[str] = []
+            for name, evaluator, on_frame in bound:
+                if on_frame:
+                    if frame is not None and evaluator(frame):
+                        flags.append(name)
+                elif evaluator(payload):
+                    flags.append(name)
+            return flags
+
+        return evaluate
 
     def evaluate(self, payload: dict) -> List[str]:
         flags: List[str] = []
@@ -31,7 +106,28 @@ class QualityFlagger:
         return flags
 
 
+def laplacian_variance(frame: np.ndarray) -> float:
+    """Variance of the 4-neighbour Laplacian of ``frame``; low values indicate blur.
+
+    Colour frames are averaged to one channel first. Computed with array
+    slicing over the interior pixels, so the cost is a few full-frame numpy
+    passes regardless of resolution.
+    """
+    import numpy as np
+
+    image: Any = frame
+    if image.ndim == 3:
+        image = image.mean(axis=2, dtype=np.float32)
+    else:
+        image = image.astype(np.float32, copy=False)
+    if image.shape[0] < 3 or image.shape[1] < 3:
+        return 0.0
+    centre = image[1:-1, 1:-1]
+    laplacian = image[:-2, 1:-1] + image[2:, 1:-1] + image[1:-1, :-2] + image[1:-1, 2:] - 4.0 * centre
+    return float(laplacian.var())
+
+
 DEFAULT_FLAGGER = QualityFlagger(enabled_flags=[])
 
 
-__all__ = ["QualityFlagger", "DEFAULT_FLAGGER"]
+__all__ = ["FrameEvaluator", "QualityFlagger", "DEFAULT_FLAGGER", "laplacian_variance"]
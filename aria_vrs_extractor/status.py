@@ -2,25 +2,58 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
 
 from .constants import DONE_DIRNAME
 from .io import Filesystem, join_uri, is_remote
+from .jsonutils import JSONDecodeError, loads
 
+_DONE_SUFFIX = ".done"
 
-def step_done_path(root: str | Path, step_name: str) -> str:
+
+def _done_dir(root: str | Path) -> str:
     base = str(root)
     if is_remote(base):
-        return join_uri(base, DONE_DIRNAME, f"{step_name}.done")
-    return str(Path(base) / DONE_DIRNAME / f"{step_name}.done")
+        return join_uri(base, DONE_DIRNAME)
+    return str(Path(base) / DONE_DIRNAME)
 
 
-def mark_done(fs: Filesystem, root: str | Path, step_name: str, payload: str | None = None) -> None:
-    marker = step_done_path(root, step_name)
-    done_dir = marker.rsplit("/", 1)[0]
-    fs.makedirs(done_dir)
-    with fs.open(marker, "wt") as handle:
-        handle.write(payload or "ok")
+def _marker_path(done_dir: str, step_name: str) -> str:
+    # done_dir comes from _done_dir, so local paths are already normalized
+    name = f"{step_name}{_DONE_SUFFIX}"
+    return join_uri(done_dir, name) if is_remote(done_dir) else os.path.join(done_dir, name)
+
+
+def step_done_path(root: str | Path, step_name: str) -> str:
+    return _marker_path(_done_dir(root), step_name)
+
+
+# done directories this process has already created; saves a makedirs per step
+_DONE_DIR_CREATED: Set[str] = set()
+
+
+def mark_done(fs: Filesystem, root: str | Path, step_name: str, payload: bytes | str | None = None) -> None:
+    """Record ``step_name`` as complete with ``payload`` (UTF-8 JSON bytes or text)."""
+    done_dir = _done_dir(root)
+    marker = _marker_path(done_dir, step_name)
+    if done_dir not in _DONE_DIR_CREATED:
+        fs.makedirs(done_dir)
+        _DONE_DIR_CREATED.add(done_dir)
+    data = (payload.encode("utf-8") if isinstance(payload, str) else payload) or b"ok"
+    try:
+        _write_marker(fs, marker, data)
+    except FileNotFoundError:
+        # the root was removed and recreated since this process created done_dir
+        fs.makedirs(done_dir)
+        _write_marker(fs, marker, data)
+
+
+def _write_marker(fs: Filesystem, marker: str, data: bytes) -> None:
+    # a crash mid-write must not leave a truncated marker that is_done accepts
+    with fs.open_atomic(marker) as handle:
+        handle.write(data)
 
 
 def is_done(fs: Filesystem, root: str | Path, step_name: str) -> bool:
@@ -32,3 +65,58 @@ def clear_done(fs: Filesystem, root: str | Path, step_name: str) -> None:
     marker = step_done_path(root, step_name)
     if fs.exists(marker):
         fs.remove(marker)
+
+
+def done_steps(fs: Filesystem, root: str | Path) -> Set[str]:
+    """Return the steps with a marker under ``root`` from a single directory listing.
+
+    Local roots use one non-recursive ``os.scandir``, whose entries already
+    carry their file type; remote roots issue one listing in place of an
+    ``exists`` call per step.
+    """
+    done_dir = _done_dir(root)
+    names: List[str]
+    if is_remote(done_dir):
+        # fsspec listings drop the URI scheme, so only the names are compared
+        names = [path.rsplit("/", 1)[-1] for path in fs.list_files(done_dir)]
+    else:
+        try:
+            with os.scandir(done_dir) as entries:
+                names = [entry.name for entry in entries if entry.is_file(follow_symlinks=False)]
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+    return {name[: -len(_DONE_SUFFIX)] for name in names if name.endswith(_DONE_SUFFIX)}
+
+
+def _parse_summary(content: Optional[bytes]) -> Optional[Dict]:
+    if not content:
+        return None
+    # whitespace-only markers fail to parse, so they need no strip() copy first
+    try:
+        summary = loads(content)
+    except JSONDecodeError:
+        return None
+    return summary if isinstance(summary, dict) else None
+
+
+def read_summary(fs: Filesystem, root: str | Path, step_name: str) -> Optional[Dict]:
+    """Return the JSON summary stored in ``step_name``'s marker, or ``None``."""
+    return read_summaries(fs, root, [step_name]).get(step_name)
+
+
+def read_summaries(fs: Filesystem, root: str | Path, steps: Iterable[str]) -> Dict[str, Dict]:
+    """Read the summaries of ``steps``, keyed by step in the given order.
+
+    Steps without a usable summary are left out. All markers are fetched in
+    one :meth:`Filesystem.read_many` call, which reads remote markers
+    concurrently.
+    """
+    steps = list(steps)
+    done_dir = _done_dir(root)
+    contents = fs.read_many([_marker_path(done_dir, step) for step in steps])
+    summaries: Dict[str, Dict] = {}
+    for step, content in zip(steps, contents):
+        summary = _parse_summary(content)
+        if summary:
+            summaries[step] = summary
+    return summaries
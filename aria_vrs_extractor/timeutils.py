@@ -3,30 +3,39 @@
 from __future__ import annotations
 
 import datetime as _dt
+import sys
 from typing import Iterable, Optional
 
 
 def ns_to_iso8601(ns: int) -> str:
     """Convert nanoseconds since epoch to ISO 8601 string."""
     seconds, nanoseconds = divmod(ns, 1_000_000_000)
-    dt = _dt.datetime.utcfromtimestamp(seconds).replace(tzinfo=_dt.timezone.utc)
+    dt = _dt.datetime.fromtimestamp(seconds, _dt.timezone.utc)
     return dt.replace(microsecond=nanoseconds // 1000).isoformat()
 
 
 def timestamp_range_ns(timestamps: Iterable[int]) -> Optional[dict]:
+    """Return ``{"start", "end"}`` for ``timestamps``, or ``None`` when empty.
+
+    Iterators are consumed. A numpy array is reduced with ``min``/``max`` in
+    place; anything else goes through one list with the builtins, so Python
+    ints beyond int64 keep working and importing this module never loads numpy.
+    """
+    np = sys.modules.get("numpy")  # an ndarray can only exist once numpy is imported
+    if np is not None and isinstance(timestamps, np.ndarray):
+        if not timestamps.size:
+            return None
+        return {"start": int(timestamps.min()), "end": int(timestamps.max())}
     values = list(timestamps)
     if not values:
         return None
-    start = min(values)
-    end = max(values)
-    return {"start": int(start), "end": int(end)}
+    return {"start": int(min(values)), "end": int(max(values))}
 
 
 def derive_partition_dt(ns: Optional[int]) -> Optional[str]:
     if ns is None:
         return None
-    seconds = ns / 1_000_000_000
-    dt = _dt.datetime.utcfromtimestamp(seconds)
+    dt = _dt.datetime.fromtimestamp(ns // 1_000_000_000, _dt.timezone.utc)
     return dt.strftime("%Y/%m/%d")
 
 
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from aria_vrs_extractor.operations._common import bind_fields
+
+
+def test_bind_fields_reads_present_attributes_in_order():
+    fields = (("lat", "latitude"), ("fix", "provider"), ("lon", "longitude"))
+    sample = SimpleNamespace(latitude=1.5, longitude=2.5)
+    read = bind_fields(sample, fields)
+    row = read(SimpleNamespace(latitude=3.0, longitude=4.0))
+    assert row == {"lat": 3.0, "fix": None, "lon": 4.0}
+    assert list(row) == ["lat", "fix", "lon"]
+    assert bind_fields(SimpleNamespace(), fields)(sample) == {"lat": None, "fix": None, "lon": None}
+
+
+def test_bind_time_reader_skips_int_only_for_int_timestamps():
+    from aria_vrs_extractor.operations._common import bind_time_reader
+
+    class Sample:
+        def __init__(self, value):
+            self.value = value
+
+        def get_time_ns(self, domain):
+            return self.value
+
+    assert bind_time_reader(Sample(5), "device")(Sample(7)) == 7
+    reader = bind_time_reader(Sample(5.0), "device")
+    assert reader(Sample(7.0)) == 7 and type(reader(Sample(7.0))) is int
@@ -0,0 +1,16 @@
+import time
+
+from aria_vrs_extractor.concurrency import OrderedTaskPool
+
+
+def test_ordered_task_pool_preserves_submission_order():
+    def work(index):
+        # later tasks finish first
+        time.sleep(0.01 * (5 - index))
+        return index
+
+    results = []
+    with OrderedTaskPool(max_workers=4, max_pending=3) as pool:
+        for index in range(5):
+            pool.submit(work, index, on_result=results.append)
+    assert results == [0, 1, 2, 3, 4]
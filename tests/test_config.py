@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -26,6 +27,7 @@ def test_config_from_yaml(tmp_path: Path) -> None:
     assert cfg.recording_id == "rec01"
     assert cfg.output_root == "/tmp/out"
     assert cfg.rgb.downscale == (640, 480)
+    assert (cfg.rgb.downscale.w, cfg.rgb.downscale.h) == (640, 480)
     assert cfg.audio.chunk_samples == 2048
     assert cfg.quality_flags.enabled == ["blur", "drop_frame", "audio_clipping"]
 
@@ -47,3 +49,33 @@ def test_override_downscale(downscale):
         assert cfg.et.downscale == (320, 240)
     else:
         assert cfg.et.downscale is None
+
+
+def test_audio_layout_validation() -> None:
+    base = {"device_id": "dev", "recording_id": "rec", "output_root": "/out"}
+    assert ExtractorConfig.from_dict(base).audio.layout == "chunks"
+    assert ExtractorConfig.from_dict({**base, "audio": {"layout": "single"}}).audio.layout == "single"
+    with pytest.raises(ValueError):
+        ExtractorConfig.from_dict({**base, "audio": {"layout": "pcm"}})
+
+
+def test_config_from_yaml_reloads_after_edit(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("device_id: devA\nrecording_id: rec01\noutput_root: /tmp/out\n")
+    assert ExtractorConfig.from_yaml(config_path).device_id == "devA"
+
+    config_path.write_text("device_id: devB\nrecording_id: rec01\noutput_root: /tmp/out\n")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert ExtractorConfig.from_yaml(config_path).device_id == "devB"
+
+
+def test_config_from_yaml_uses_json_cache(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("device_id: devA\nrecording_id: rec01\noutput_root: /tmp/out\n")
+    ExtractorConfig.from_yaml(config_path)
+
+    cache_path = tmp_path / "config.yaml.cache.json"
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert cached["source_mtime_ns"] == config_path.stat().st_mtime_ns
+    assert cached["data"]["device_id"] == "devA"
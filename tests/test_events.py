@@ -75,3 +75,12 @@ def test_merge_events_sorted(tmp_path: Path) -> None:
     lines = [json.loads(line) for line in events_path.read_text(encoding="utf-8").splitlines()]
     timestamps = [row["ts_ns"] for row in lines]
     assert timestamps == [1, 2, 3, 5]
+
+
+def test_line_timestamp_fast_path_and_fallback() -> None:
+    from aria_vrs_extractor.operations.events import _line_timestamp
+
+    assert _line_timestamp(b'{"ts_ns":-7,"sensor":"imu"}') == -7
+    assert _line_timestamp(b'{"sensor":"gps","ts_ns":12}') == 12
+    assert _line_timestamp(b'{"ts_ns":3,"sensor":') is None
+    assert _line_timestamp(b'{"sensor":"gps"}') is None
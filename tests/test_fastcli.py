@@ -0,0 +1,44 @@
+import pytest
+
+from aria_vrs_extractor import fastcli
+from aria_vrs_extractor.operations import manifest
+
+
+def _capture_manifest_fs(monkeypatch):
+    seen = {}
+    monkeypatch.setattr(manifest, "write_manifest", lambda *, fs, **kwargs: seen.setdefault("fs", fs))
+    return seen
+
+
+def test_write_manifest_checksum_workers_from_flag_or_config(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("device_id: dev\nrecording_id: rec\noutput_root: /out\nchecksum_workers: 3\n")
+    base = ["write-manifest", "--root", str(tmp_path), "--owner", "lab", "--tool-version", "0.1"]
+
+    seen = _capture_manifest_fs(monkeypatch)
+    fastcli.main([*base, "--config", str(config_path)])
+    assert seen["fs"].max_workers == 3
+
+    seen = _capture_manifest_fs(monkeypatch)
+    fastcli.main([*base, "--config", str(config_path), "--checksum-workers", "5"])
+    assert seen["fs"].max_workers == 5
+
+
+def test_write_manifest_rejects_non_positive_checksum_workers(tmp_path, monkeypatch):
+    seen = _capture_manifest_fs(monkeypatch)
+    argv = ["write-manifest", "--root", str(tmp_path), "--owner", "lab", "--tool-version", "0.1"]
+    with pytest.raises(SystemExit) as excinfo:
+        fastcli.main([*argv, "--checksum-workers", "0"])
+    assert excinfo.value.code == 2
+    assert "fs" not in seen
+
+
+def test_abbreviated_options_fall_back_to_typer(tmp_path, monkeypatch):
+    from aria_vrs_extractor.operations import events
+
+    merged = []
+    monkeypatch.setattr(events, "merge_events", lambda **kwargs: merged.append(kwargs))
+    with pytest.raises(SystemExit) as excinfo:
+        fastcli.main(["merge-events", "--ro", str(tmp_path)])
+    assert excinfo.value.code == 2
+    assert merged == []
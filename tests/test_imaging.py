@@ -0,0 +1,37 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from aria_vrs_extractor.imaging import encode_jpeg
+
+
+def test_encode_jpeg_roundtrip_gray_and_rgb():
+    gray = np.full((8, 12), 128, dtype=np.uint8)
+    rgb = np.zeros((8, 12, 3), dtype=np.uint8)
+    for array, mode in ((gray, "L"), (rgb, "RGB")):
+        decoded = Image.open(io.BytesIO(encode_jpeg(array)))
+        assert decoded.format == "JPEG"
+        assert decoded.mode == mode
+        assert decoded.size == (12, 8)
+
+
+def test_resize_returns_requested_shape():
+    from aria_vrs_extractor.imaging import resize
+
+    array = np.zeros((8, 12, 3), dtype=np.uint8)
+    assert resize(array, 6, 4).shape == (4, 6, 3)
+
+
+def test_resize_backends_agree_when_shrinking(monkeypatch):
+    pytest.importorskip("cv2")
+    from aria_vrs_extractor import imaging
+
+    # one-pixel stripes alias to solid black or white without an antialiasing filter
+    stripes = np.zeros((64, 64), dtype=np.uint8)
+    stripes[:, ::2] = 255
+    with_cv2 = imaging.resize(stripes, 16, 16).astype(np.int16)
+    monkeypatch.setattr(imaging, "cv2", None)
+    with_pillow = imaging.resize(stripes, 16, 16).astype(np.int16)
+    assert np.abs(with_cv2 - with_pillow).mean() < 8
@@ -1,14 +1,40 @@
-from aria_vrs_extractor.io import Filesystem, join_uri, is_remote
+import pytest
 
+from aria_vrs_extractor.io import Filesystem, LineBuffer, is_remote, join_local, join_uri
 
-def test_join_uri_local():
-    base = "/tmp/root"
-    assert join_uri(base, "sensors", "rgb.jsonl") == "/tmp/root/sensors/rgb.jsonl"
 
+@pytest.mark.parametrize(
+    "base,parts,expected",
+    [
+        ("/tmp/root", ("sensors", "rgb.jsonl"), "/tmp/root/sensors/rgb.jsonl"),
+        ("s3://bucket/raw", ("aria", "rec01"), "s3://bucket/raw/aria/rec01"),
+        ("s3://bucket/raw/", ("/aria/", "", "rec01"), "s3://bucket/raw/aria/rec01"),
+        ("s3://bucket/raw/", (), "s3://bucket/raw"),
+        ("/tmp/root", (), "/tmp/root"),
+        ("./out", ("a",), "out/a"),
+        ("out", ("./a",), "out/a"),
+        ("out/", (), "out"),
+        ("out//sub/", ("a/",), "out/sub/a"),
+    ],
+)
+def test_join_uri(base, parts, expected):
+    assert join_uri(base, *parts) == expected
+    if not is_remote(base):
+        assert join_local(base, *parts) == expected
 
-def test_join_uri_remote():
-    base = "s3://bucket/raw"
-    assert join_uri(base, "aria", "rec01") == "s3://bucket/raw/aria/rec01"
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("s3://bucket/raw", True),
+        ("gs://bucket/raw", True),
+        ("file:///tmp/root", False),
+        ("/tmp/root", False),
+        ("relative/path", False),
+    ],
+)
+def test_is_remote(path, expected):
+    assert is_remote(path) is expected
 
 
 def test_filesystem_open_local(tmp_path):
@@ -17,3 +43,90 @@ def test_filesystem_open_local(tmp_path):
     with fs.open(str(file_path), "wt") as handle:
         handle.write("hello")
     assert file_path.read_text() == "hello"
+
+
+def test_compute_checksums_local(tmp_path):
+    import hashlib
+
+    fs = Filesystem()
+    for name, content in (("empty.bin", b""), ("small.bin", b"aria-vrs")):
+        file_path = tmp_path / name
+        file_path.write_bytes(content)
+        info = fs.compute_checksums(str(file_path), with_md5=True)
+        assert info.size == len(content)
+        assert info.checksum_sha256 == hashlib.sha256(content).hexdigest()
+        assert info.checksum_md5 == hashlib.md5(content).hexdigest()
+        assert fs.compute_checksums(str(file_path)).checksum_md5 is None
+
+
+def test_list_files_local_recursive(tmp_path):
+    fs = Filesystem()
+    (tmp_path / "frames" / "left").mkdir(parents=True)
+    (tmp_path / "frames" / "frame_000000.jpg").write_bytes(b"a")
+    (tmp_path / "frames" / "left" / "frame_000001.jpg").write_bytes(b"b")
+
+    listed = sorted(fs.list_files(str(tmp_path / "frames")))
+    assert listed == [
+        str(tmp_path / "frames" / "frame_000000.jpg"),
+        str(tmp_path / "frames" / "left" / "frame_000001.jpg"),
+    ]
+    assert list(fs.list_files(str(tmp_path / "missing"))) == []
+
+
+def test_line_buffer_batches_writes():
+    import io
+
+    handle = io.BytesIO()
+    with LineBuffer(handle, batch_size=2) as buffer:
+        buffer.write(b"a\n")
+        assert handle.getvalue() == b""
+        buffer.write(b"b\n")
+        assert handle.getvalue() == b"a\nb\n"
+        buffer.write(b"c\n")
+    assert handle.getvalue() == b"a\nb\nc\n"
+
+
+def test_open_jsonl_local_flushes_on_exit(tmp_path):
+    fs = Filesystem()
+    path = tmp_path / "sensors" / "imu.jsonl"
+    path.parent.mkdir()
+    with fs.open_jsonl(str(path)) as lines:
+        lines.write(b'{"ts_ns":1}\n')
+        lines.write(b'{"ts_ns":2}\n')
+    assert path.read_bytes() == b'{"ts_ns":1}\n{"ts_ns":2}\n'
+
+
+def test_read_many_local(tmp_path):
+    small = tmp_path / "small.done"
+    small.write_bytes(b'{"count": 1}')
+    large = tmp_path / "large.bin"
+    large.write_bytes(bytes(range(256)) * 8192)
+    fs = Filesystem()
+    assert fs.read_many([str(small), str(tmp_path / "missing"), str(large)]) == [
+        b'{"count": 1}',
+        None,
+        large.read_bytes(),
+    ]
+
+
+def test_open_atomic_replaces_only_on_success(tmp_path):
+    fs = Filesystem()
+    target = tmp_path / "manifest.json"
+    target.write_bytes(b"old")
+    with pytest.raises(RuntimeError):
+        with fs.open_atomic(str(target)) as handle:
+            handle.write(b"partial")
+            raise RuntimeError("boom")
+    assert target.read_bytes() == b"old"
+    with fs.open_atomic(str(target)) as handle:
+        handle.write(b"new")
+    assert target.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+
+def test_write_bytes_local(tmp_path):
+    fs = Filesystem()
+    target = tmp_path / "chunk.wav"
+    target.write_bytes(b"stale contents")
+    fs.write_bytes(str(target), b"RIFF", memoryview(b"data"))
+    assert target.read_bytes() == b"RIFFdata"
@@ -2,9 +2,12 @@ import json
 import logging
 from pathlib import Path
 
+import pytest
+
 from aria_vrs_extractor.constants import DONE_DIRNAME
 from aria_vrs_extractor.io import Filesystem
-from aria_vrs_extractor.operations.manifest import write_manifest
+from aria_vrs_extractor.jsonutils import dumps
+from aria_vrs_extractor.operations.manifest import _collect_directory_checksums, _encode_manifest, write_manifest
 
 
 def write_summary(path: Path, summary: dict) -> None:
@@ -97,3 +100,28 @@ def test_write_manifest(tmp_path: Path) -> None:
     assert manifest["session"]["recording_id"] == "rec01"
     assert manifest["partition_keys"]["dt"] == "2024/01/01"
     assert any(entry["stream_type"] == "rgb" for entry in manifest["files"])
+    directory_entries = [entry for entry in manifest["files"] if entry["logical_path"].endswith("/")]
+    assert len(directory_entries) == 2
+    # directory rollups publish SHA-256 only; MD5 stays on the JSONL entries
+    assert all(set(entry["checksum"]) == {"sha256"} for entry in directory_entries)
+    jsonl_entries = [entry for entry in manifest["files"] if not entry["logical_path"].endswith("/")]
+    assert all(set(entry["checksum"]) == {"sha256", "md5"} for entry in jsonl_entries)
+
+
+def test_encode_manifest_matches_dumps() -> None:
+    manifest = {
+        "schema_version": "1.0.0",
+        "session": {"recording_id": "rec01", "tags": []},
+        "files": [{"logical_path": "sensors/imu.jsonl", "checksum": {"sha256": "00"}}, {"count": 0}],
+        "lineage": {"upstream": ["vrs://example"]},
+    }
+    for value in (manifest, {**manifest, "files": []}):
+        assert b"".join(_encode_manifest(value)) == dumps(value, indent=True, newline=True)
+
+
+def test_directory_rollup_adds_blake3_when_requested(tmp_path: Path) -> None:
+    pytest.importorskip("blake3")
+    create_file(tmp_path / "frames" / "frame_000001.jpg", b"rgbdata")
+    rollup = _collect_directory_checksums(Filesystem(), str(tmp_path / "frames"), with_blake3=True)
+    assert rollup is not None
+    assert set(rollup["checksum"]) == {"sha256", "blake3"}
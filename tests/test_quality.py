@@ -0,0 +1,42 @@
+import numpy as np
+
+from aria_vrs_extractor.quality import QualityFlagger, laplacian_variance
+
+
+def test_compile_matches_evaluate_and_respects_sensor_scope():
+    flagger = QualityFlagger(enabled_flags=["gap", "saturated"])
+    flagger.register("gap", lambda payload: payload.get("gap", False))
+    flagger.register("saturated", lambda payload: True, sensors=["imu"])
+
+    payload = {"gap": True}
+    assert flagger.compile("imu")(payload) == flagger.evaluate(payload) == ["gap", "saturated"]
+    assert flagger.compile("gps")(payload) == ["gap"]
+    assert QualityFlagger(enabled_flags=["gap"]).compile("imu")(payload) == []
+
+
+def test_frame_evaluators_run_on_the_array():
+    flagger = QualityFlagger(enabled_flags=["gap", "blur"])
+    flagger.register("gap", lambda payload: payload.get("gap", False))
+    flagger.register_frame("blur", lambda frame: laplacian_variance(frame) < 10.0, sensors=["rgb"])
+
+    flat = np.full((8, 8, 3), 128, dtype=np.uint8)
+    checker = (np.indices((8, 8)).sum(axis=0) % 2 * 255).astype(np.uint8)
+    evaluate = flagger.compile("rgb")
+    assert evaluate({"gap": True}, flat) == ["gap", "blur"]
+    assert evaluate({}, checker) == []
+    assert evaluate({}) == []
+    assert flagger.compile("imu")({}, flat) == []
+    assert laplacian_variance(flat) == 0.0
+
+
+def test_blur_flag_is_registered_only_with_a_threshold():
+    from aria_vrs_extractor.commands import build_quality_flagger
+    from aria_vrs_extractor.config import ExtractorConfig
+
+    base = {"device_id": "dev", "recording_id": "rec", "output_root": "/out"}
+    flat = np.full((8, 8), 128, dtype=np.uint8)
+    assert build_quality_flagger(ExtractorConfig.from_dict(base)).compile("rgb")({}, flat) == []
+    config = ExtractorConfig.from_dict({**base, "quality_flags": {"blur_threshold": 10}})
+    flagger = build_quality_flagger(config)
+    assert flagger.compile("rgb")({}, flat) == ["blur"]
+    assert flagger.compile("imu")({}, flat) == []
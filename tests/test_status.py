@@ -0,0 +1,44 @@
+import shutil
+from pathlib import Path
+
+from aria_vrs_extractor.constants import DONE_DIRNAME
+from aria_vrs_extractor.io import Filesystem
+from aria_vrs_extractor.status import clear_done, done_steps, is_done, mark_done, read_summaries, read_summary
+
+
+def test_mark_done_replaces_marker(tmp_path: Path) -> None:
+    fs = Filesystem()
+    root = str(tmp_path)
+    mark_done(fs, root, "extract_rgb", '{"count": 1}')
+    mark_done(fs, root, "extract_rgb", '{"count": 2}')
+    done_dir = tmp_path / DONE_DIRNAME
+    assert [p.name for p in done_dir.iterdir()] == ["extract_rgb.done"]
+    assert (done_dir / "extract_rgb.done").read_text(encoding="utf-8") == '{"count": 2}'
+    assert is_done(fs, root, "extract_rgb")
+    clear_done(fs, root, "extract_rgb")
+    assert not is_done(fs, root, "extract_rgb")
+
+
+def test_done_steps_and_read_summary(tmp_path: Path) -> None:
+    fs = Filesystem()
+    root = str(tmp_path)
+    assert done_steps(fs, root) == set()
+    mark_done(fs, root, "extract_imu", b'{"sensor": "imu"}')
+    mark_done(fs, root, "extract_gps")
+    (tmp_path / DONE_DIRNAME / "notes.txt").write_text("ignored", encoding="utf-8")
+    assert done_steps(fs, root) == {"extract_imu", "extract_gps"}
+    assert read_summary(fs, root, "extract_imu") == {"sensor": "imu"}
+    assert read_summary(fs, root, "extract_gps") is None
+    assert read_summary(fs, root, "extract_bt") is None
+    assert read_summaries(fs, root, ["extract_gps", "extract_imu", "extract_bt"]) == {"extract_imu": {"sensor": "imu"}}
+
+
+def test_mark_done_after_root_is_recreated(tmp_path: Path) -> None:
+    fs = Filesystem()
+    root = tmp_path / "out"
+    root.mkdir()
+    mark_done(fs, str(root), "extract_rgb")
+    shutil.rmtree(root)
+    root.mkdir()
+    mark_done(fs, str(root), "extract_imu")
+    assert done_steps(fs, str(root)) == {"extract_imu"}
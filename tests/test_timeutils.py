@@ -0,0 +1,14 @@
+import numpy as np
+
+from aria_vrs_extractor.timeutils import timestamp_range_ns
+
+
+def test_timestamp_range_ns() -> None:
+    assert timestamp_range_ns([]) is None
+    assert timestamp_range_ns(iter([5, 1_700_000_000_000_000_000, -3])) == {
+        "start": -3,
+        "end": 1_700_000_000_000_000_000,
+    }
+    assert timestamp_range_ns(np.array([7, 2], dtype=np.int64)) == {"start": 2, "end": 7}
+    assert timestamp_range_ns(np.array([], dtype=np.int64)) is None
+    assert timestamp_range_ns([2**63, 1]) == {"start": 1, "end": 2**63}